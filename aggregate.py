@@ -0,0 +1,142 @@
+import time
+from collections import deque
+from typing import Hashable, Optional
+
+from homework import InfoMessage, read_package
+
+WINDOWS: dict[str, float] = {'hour': 3600, 'day': 86400}
+BUCKETS: int = 60
+
+
+class Totals:
+    """Накопленные суммы по тренировкам одного вида."""
+    __slots__ = ('count', 'duration', 'distance', 'calories')
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.duration: float = 0.0
+        self.distance: float = 0.0
+        self.calories: float = 0.0
+
+    def add(self, info: InfoMessage) -> None:
+        """Учесть результат тренировки."""
+        self.count += 1
+        self.duration += info.duration
+        self.distance += info.distance
+        self.calories += info.calories
+
+    def merge(self, other: 'Totals', sign: int = 1) -> None:
+        """Прибавить (или вычесть при `sign=-1`) другие суммы."""
+        self.count += sign * other.count
+        self.duration += sign * other.duration
+        self.distance += sign * other.distance
+        self.calories += sign * other.calories
+
+    def snapshot(self) -> dict:
+        """Вернуть суммы и средние значения."""
+        return {
+            'count': self.count,
+            'duration': self.duration,
+            'distance': self.distance,
+            'calories': self.calories,
+            'mean_speed': (self.distance / self.duration
+                           if self.duration else 0.0),
+            'mean_calories': (self.calories / self.count
+                              if self.count else 0.0),
+        }
+
+
+class WindowedTotals:
+    """Суммы за скользящее окно из кольца временных корзин."""
+    __slots__ = ('width', 'buckets', 'total')
+
+    def __init__(self, window: float, buckets: int = BUCKETS) -> None:
+        self.width: float = window / buckets
+        self.buckets: deque = deque(maxlen=buckets)
+        self.total: Totals = Totals()
+
+    def expire(self, timestamp: float) -> None:
+        """Убрать корзины, вышедшие за границу окна.
+
+        Пустое окно обнуляется заново, чтобы не копить остаток от
+        вычитания чисел с плавающей точкой.
+        """
+        oldest = int(timestamp // self.width) - self.buckets.maxlen
+        while self.buckets and self.buckets[0][0] <= oldest:
+            self.total.merge(self.buckets.popleft()[1], sign=-1)
+        if not self.buckets:
+            self.total = Totals()
+
+    def add(self, info: InfoMessage, timestamp: float) -> None:
+        """Учесть результат тренировки в момент `timestamp`.
+
+        Опоздавшие тренировки попадают в последнюю открытую корзину.
+        """
+        self.expire(timestamp)
+        bucket_id = int(timestamp // self.width)
+        if not self.buckets or bucket_id > self.buckets[-1][0]:
+            self.buckets.append((bucket_id, Totals()))
+        self.buckets[-1][1].add(info)
+        self.total.add(info)
+
+
+class Aggregator:
+    """Инкрементальные итоги тренировок по спортсменам."""
+
+    def __init__(self,
+                 windows: Optional[dict[str, float]] = None,
+                 buckets: int = BUCKETS) -> None:
+        self.windows: dict[str, float] = (WINDOWS if windows is None
+                                          else windows)
+        self.buckets: int = buckets
+        self.totals: dict[Hashable, dict[str, Totals]] = {}
+        self.windowed: dict[Hashable, dict[tuple, WindowedTotals]] = {}
+
+    def add(self,
+            athlete: Hashable,
+            workout_type: str,
+            data: list,
+            timestamp: Optional[float] = None) -> InfoMessage:
+        """Рассчитать пакет спортсмена и учесть его в итогах."""
+        info = read_package(workout_type, data).show_training_info()
+        self.add_info(athlete, info, timestamp)
+        return info
+
+    def add_info(self,
+                 athlete: Hashable,
+                 info: InfoMessage,
+                 timestamp: Optional[float] = None) -> None:
+        """Учесть готовый результат тренировки спортсмена."""
+        totals = self.totals.setdefault(athlete, {})
+        if info.training_type not in totals:
+            totals[info.training_type] = Totals()
+        totals[info.training_type].add(info)
+        if not self.windows:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        windowed = self.windowed.setdefault(athlete, {})
+        for name, window in self.windows.items():
+            key = (name, info.training_type)
+            if key not in windowed:
+                windowed[key] = WindowedTotals(window, self.buckets)
+            windowed[key].add(info, timestamp)
+
+    def snapshot(self,
+                 athlete: Hashable,
+                 window: Optional[str] = None,
+                 now: Optional[float] = None) -> dict[str, dict]:
+        """Вернуть итоги спортсмена по видам тренировок."""
+        if window is None:
+            return {training_type: totals.snapshot()
+                    for training_type, totals
+                    in self.totals.get(athlete, {}).items()}
+        if now is None:
+            now = time.time()
+        result = {}
+        for (name, training_type), windowed in self.windowed.get(
+                athlete, {}).items():
+            if name == window:
+                windowed.expire(now)
+                result[training_type] = windowed.total.snapshot()
+        return result
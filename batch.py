@@ -0,0 +1,151 @@
+from typing import Callable, NamedTuple, Optional, Sequence
+
+from homework import InfoMessage, Running, SportsWalking, Swimming
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BatchResult(NamedTuple):
+    """Колонки рассчитанных показателей пакета тренировок."""
+    distance: Sequence[float]
+    speed: Sequence[float]
+    calories: Sequence[float]
+
+
+def _swimming(action, duration, weight, height, length_pool, count_pool):
+    distance = action * Swimming.LEN_STEP / Swimming.M_IN_KM
+    speed = (length_pool
+             * count_pool
+             / Swimming.M_IN_KM
+             / duration)
+    calories = ((speed
+                + Swimming.CORRECTION_COEFFICIENT_1)
+                * Swimming.CORRECTION_COEFFICIENT_2
+                * weight)
+    return distance, speed, calories
+
+
+def _running(action, duration, weight, height, length_pool, count_pool):
+    distance = action * Running.LEN_STEP / Running.M_IN_KM
+    speed = distance / duration
+    calories = ((Running.CORRECTION_COEFFICIENT_1
+                * speed
+                - Running.CORRECTION_COEFFICIENT_2)
+                * weight
+                / Running.M_IN_KM
+                * (duration * Running.MINUTES_IN_HOUR))
+    return distance, speed, calories
+
+
+def _sports_walking(action, duration, weight, height, length_pool,
+                    count_pool):
+    distance = action * SportsWalking.LEN_STEP / SportsWalking.M_IN_KM
+    speed = distance / duration
+    calories = ((SportsWalking.CORRECTION_COEFFICIENT_1
+                * weight
+                + (speed**2 // height)
+                * SportsWalking.CORRECTION_COEFFICIENT_2
+                * weight)
+                * (duration * SportsWalking.MINUTES_IN_HOUR))
+    return distance, speed, calories
+
+
+KERNELS: dict[str, Callable] = {
+    'SWM': _swimming,
+    'RUN': _running,
+    'WLK': _sports_walking,
+}
+
+COLUMNS: tuple[str, ...] = ('workout_type', 'action', 'duration', 'weight',
+                            'height', 'length_pool', 'count_pool')
+
+CLASS_NAMES: dict[str, str] = {
+    'SWM': Swimming.__name__,
+    'RUN': Running.__name__,
+    'WLK': SportsWalking.__name__,
+}
+
+
+def _check_codes(codes) -> None:
+    unknown = set(codes) - KERNELS.keys()
+    if unknown:
+        raise ValueError('Нет такого вида тренировки')
+
+
+def _compute_python(columns: list) -> BatchResult:
+    _check_codes(columns[0])
+    distance, speed, calories = [], [], []
+    for code, *row in zip(*columns):
+        row_distance, row_speed, row_calories = KERNELS[code](*row)
+        distance.append(row_distance)
+        speed.append(row_speed)
+        calories.append(row_calories)
+    return BatchResult(distance, speed, calories)
+
+
+def _compute_numpy(columns: list) -> BatchResult:
+    codes = np.asarray(columns[0])
+    values = [np.asarray(column, dtype=np.float64) for column in columns[1:]]
+    _check_codes(np.unique(codes).tolist())
+    duration, height = values[1], values[3]
+    if (duration == 0).any() or ((codes == 'WLK') & (height == 0)).any():
+        raise ZeroDivisionError('float division by zero')
+    result = BatchResult(*(np.empty(len(codes)) for _ in BatchResult._fields))
+    for code, kernel in KERNELS.items():
+        mask = codes == code
+        if not mask.any():
+            continue
+        group = kernel(*(column[mask] for column in values))
+        for target, computed in zip(result, group):
+            target[mask] = computed
+    return result
+
+
+def compute_batch(workout_type: Sequence[str],
+                  action: Sequence[int],
+                  duration: Sequence[float],
+                  weight: Sequence[float],
+                  height: Optional[Sequence[float]] = None,
+                  length_pool: Optional[Sequence[float]] = None,
+                  count_pool: Optional[Sequence[float]] = None,
+                  use_numpy: bool = True) -> BatchResult:
+    """Рассчитать дистанцию, скорость и калории для пакета тренировок.
+
+    Как и классы тренировок, нулевая длительность или рост при ходьбе
+    вызывают `ZeroDivisionError` — с NumPy и без него.
+    """
+    size = len(workout_type)
+    columns = [workout_type, action, duration, weight,
+               height, length_pool, count_pool]
+    columns = [[0] * size if column is None else column
+               for column in columns]
+    if use_numpy and np is not None:
+        return _compute_numpy(columns)
+    return _compute_python(columns)
+
+
+def packages_to_columns(packages) -> dict[str, list]:
+    """Разложить пакеты `(workout_type, data)` по колонкам."""
+    columns: dict[str, list] = {name: [] for name in COLUMNS}
+    for workout_type, data in packages:
+        action, duration, weight, *extra = data
+        height = extra[0] if workout_type == 'WLK' else 0
+        length_pool, count_pool = extra if workout_type == 'SWM' else (0, 0)
+        for name, value in zip(COLUMNS, (workout_type, action, duration,
+                                         weight, height, length_pool,
+                                         count_pool)):
+            columns[name].append(value)
+    return columns
+
+
+def to_messages(workout_type: Sequence[str],
+                duration: Sequence[float],
+                result: BatchResult) -> list[InfoMessage]:
+    """Собрать информационные сообщения из рассчитанных колонок."""
+    return [InfoMessage(CLASS_NAMES[code], float(hours), float(distance),
+                        float(speed), float(calories))
+            for code, hours, distance, speed, calories
+            in zip(workout_type, duration, *result)]
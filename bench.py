@@ -0,0 +1,163 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Optional
+
+from homework import read_package
+from threaded import gil_enabled, run_threaded
+
+SIZES: tuple[int, ...] = (1000, 10000, 100000)
+MIX: dict[str, float] = {'SWM': 1, 'RUN': 1, 'WLK': 1}
+THRESHOLD: float = 0.1
+SEED: int = 0
+
+
+def generate_package(workout_type: str, rng: random.Random) -> tuple:
+    """Сгенерировать правдоподобный пакет данных датчиков."""
+    duration = rng.uniform(0.25, 3)
+    weight = rng.uniform(45, 120)
+    if workout_type == 'SWM':
+        count_pool = rng.randint(10, 80)
+        return workout_type, [count_pool * rng.randint(15, 30), duration,
+                              weight, rng.choice((25, 50)), count_pool]
+    action = rng.randint(2000, 30000)
+    if workout_type == 'WLK':
+        return workout_type, [action, duration, weight,
+                              rng.uniform(150, 200)]
+    return workout_type, [action, duration, weight]
+
+
+def generate_packages(size: int,
+                      mix: Optional[dict[str, float]] = None,
+                      seed: int = SEED) -> list:
+    """Сгенерировать смесь пакетов заданного размера."""
+    mix = mix or MIX
+    rng = random.Random(seed)
+    codes = rng.choices(list(mix), weights=list(mix.values()), k=size)
+    return [generate_package(code, rng) for code in codes]
+
+
+def percentile(ordered: list, share: float) -> float:
+    """Вернуть перцентиль отсортированной выборки."""
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def measure(call: Callable, items: list) -> dict:
+    """Измерить пропускную способность и задержки вызова."""
+    clock = time.perf_counter_ns
+    started = clock()
+    for item in items:
+        call(item)
+    elapsed = clock() - started
+    latencies = []
+    for item in items:
+        call_started = clock()
+        call(item)
+        latencies.append(clock() - call_started)
+    latencies.sort()
+    return {
+        'ops_per_sec': len(items) / (elapsed / 1e9) if elapsed else 0.0,
+        'p50_ns': percentile(latencies, 0.5),
+        'p95_ns': percentile(latencies, 0.95),
+        'p99_ns': percentile(latencies, 0.99),
+    }
+
+
+def run_size(packages: list) -> dict:
+    """Прогнать все сценарии на одном наборе пакетов."""
+    results = {
+        'read_package': measure(lambda package: read_package(*package),
+                                packages),
+    }
+    for code in MIX:
+        group = [package for package in packages if package[0] == code]
+        if group:
+            results[f'get_spent_calories[{code}]'] = measure(
+                lambda training: training.get_spent_calories(),
+                [read_package(*package) for package in group])
+    trainings = [read_package(*package) for package in packages]
+    results['show_training_info'] = measure(
+        lambda training: training.show_training_info(), trainings)
+    infos = [training.show_training_info() for training in trainings]
+    results['get_message'] = measure(lambda info: info.get_message(), infos)
+    return results
+
+
+def thread_scaling(packages: list, max_workers: int) -> dict[str, float]:
+    """Измерить пропускную способность пула потоков от 1 до N потоков."""
+    results = {}
+    for workers in range(1, max_workers + 1):
+        started = time.perf_counter()
+        run_threaded(packages, workers)
+        elapsed = time.perf_counter() - started
+        results[str(workers)] = len(packages) / elapsed if elapsed else 0.0
+    return results
+
+
+def run(sizes: tuple = SIZES,
+        mix: Optional[dict[str, float]] = None,
+        seed: int = SEED,
+        threads: int = 0) -> dict:
+    """Прогнать набор бенчмарков для всех размеров."""
+    results: dict = {}
+    scaling: dict = {}
+    for size in sizes:
+        packages = generate_packages(size, mix, seed)
+        for name, stats in run_size(packages).items():
+            results.setdefault(name, {})[str(size)] = stats
+        if threads:
+            scaling[str(size)] = thread_scaling(packages, threads)
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'gil_enabled': gil_enabled(),
+        'seed': seed,
+        'results': results,
+    }
+    if threads:
+        report['threads'] = scaling
+    return report
+
+
+def compare(current: dict, baseline: dict,
+            threshold: float = THRESHOLD) -> list[str]:
+    """Найти сценарии, пропускная способность которых упала."""
+    regressions = []
+    for name, sizes in current['results'].items():
+        for size, stats in sizes.items():
+            saved = baseline['results'].get(name, {}).get(size)
+            if not saved or not saved['ops_per_sec']:
+                continue
+            change = stats['ops_per_sec'] / saved['ops_per_sec'] - 1
+            if change < -threshold:
+                regressions.append(f'{name} [{size}]: {change:+.1%}')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Бенчмарки иерархии тренировок.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    parser.add_argument('--threads', type=int, default=0,
+                        help='замерить масштабирование от 1 до N потоков')
+    args = parser.parse_args()
+    current = run(tuple(args.sizes), seed=args.seed, threads=args.threads)
+    report = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            output.write(report)
+    else:
+        print(report)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as saved:
+            regressions = compare(current, json.load(saved), args.threshold)
+        for regression in regressions:
+            print(f'Регрессия: {regression}', file=sys.stderr)
+        sys.exit(1 if regressions else 0)
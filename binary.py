@@ -0,0 +1,159 @@
+import mmap
+import struct
+from typing import BinaryIO, Iterable, Iterator
+
+from homework import WORKOUT_TYPES, Training, read_package
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC: bytes = b'TRN2'
+RECORD = struct.Struct('<4s6d')
+FIELDS: tuple[str, ...] = ('workout_type', 'action', 'duration', 'weight',
+                           'height', 'length_pool', 'count_pool')
+EXTRA_FIELDS: dict[str, tuple[str, ...]] = {
+    'SWM': ('length_pool', 'count_pool'),
+    'RUN': (),
+    'WLK': ('height',),
+}
+WRITE_BATCH: int = 8192
+
+if np is not None:
+    RECORD_DTYPE = np.dtype({
+        'names': list(FIELDS),
+        'formats': ['S4', '<f8', '<f8', '<f8', '<f8', '<f8', '<f8'],
+        'offsets': [0, 4, 12, 20, 28, 36, 44],
+        'itemsize': RECORD.size,
+    })
+
+
+def pack_record(workout_type: str, data: list) -> bytes:
+    """Упаковать пакет данных датчиков в запись фиксированной длины."""
+    if workout_type not in EXTRA_FIELDS:
+        raise ValueError('Нет такого вида тренировки')
+    if not WORKOUT_TYPES[workout_type].accepts(data):
+        raise ValueError('Неверное число полей пакета')
+    action, duration, weight, *extra = data
+    values = dict(zip(EXTRA_FIELDS[workout_type], extra))
+    return RECORD.pack(workout_type.encode('ascii'), action, duration,
+                       weight, values.get('height', 0),
+                       values.get('length_pool', 0),
+                       values.get('count_pool', 0))
+
+
+def unpack_record(code: bytes, action: float, duration: float, weight: float,
+                  height: float, length_pool: float,
+                  count_pool: float) -> tuple[str, list]:
+    """Преобразовать поля записи обратно в пакет данных датчиков."""
+    workout_type = code.rstrip(b'\0').decode('ascii')
+    values = {'height': height, 'length_pool': length_pool,
+              'count_pool': count_pool}
+    data = [action, duration, weight]
+    data.extend(values[name] for name in EXTRA_FIELDS.get(workout_type, ()))
+    return workout_type, data
+
+
+def write_records(target: BinaryIO, packages: Iterable) -> int:
+    """Записать пакеты в двоичный файл крупными блоками."""
+    target.write(MAGIC)
+    count = 0
+    chunk = bytearray()
+    for workout_type, data in packages:
+        chunk += pack_record(workout_type, data)
+        count += 1
+        if count % WRITE_BATCH == 0:
+            target.write(chunk)
+            chunk.clear()
+    target.write(chunk)
+    return count
+
+
+def records_view(buffer) -> memoryview:
+    """Проверить заголовок и вернуть представление записей без копии."""
+    view = memoryview(buffer).cast('B')
+    if view[:len(MAGIC)] != MAGIC:
+        raise ValueError('Неизвестный формат файла тренировок')
+    records = view[len(MAGIC):]
+    if len(records) % RECORD.size:
+        raise ValueError('Файл тренировок обрезан')
+    return records
+
+
+def iter_packages(buffer) -> Iterator[tuple[str, list]]:
+    """Читать пакеты прямо из буфера с записями."""
+    for fields in RECORD.iter_unpack(records_view(buffer)):
+        yield unpack_record(*fields)
+
+
+def read_record(buffer, index: int) -> Training:
+    """Создать тренировку из записи буфера по её номеру."""
+    fields = RECORD.unpack_from(records_view(buffer), index * RECORD.size)
+    return read_package(*unpack_record(*fields))
+
+
+def as_array(buffer):
+    """Вернуть структурированный массив NumPy поверх буфера без копии."""
+    if np is None:
+        raise RuntimeError('Для представления записей нужен NumPy')
+    return np.frombuffer(records_view(buffer), dtype=RECORD_DTYPE)
+
+
+def columns(buffer) -> dict:
+    """Вернуть колонки записей в формате `batch.compute_batch`."""
+    if np is not None:
+        array = as_array(buffer)
+        result = {name: array[name] for name in FIELDS[1:]}
+        result['workout_type'] = np.char.decode(array['workout_type'],
+                                                'ascii')
+        return result
+    result: dict = {name: [] for name in FIELDS}
+    for fields in RECORD.iter_unpack(records_view(buffer)):
+        for name, value in zip(FIELDS, fields):
+            result[name].append(value)
+    result['workout_type'] = [code.rstrip(b'\0').decode('ascii')
+                              for code in result['workout_type']]
+    return result
+
+
+class RecordFile:
+    """Файл записей тренировок, отображённый в память."""
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0,
+                               access=mmap.ACCESS_READ)
+        self.records: memoryview = records_view(self._mmap)
+
+    def __enter__(self) -> 'RecordFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.records) // RECORD.size
+
+    def __iter__(self) -> Iterator[tuple[str, list]]:
+        for fields in RECORD.iter_unpack(self.records):
+            yield unpack_record(*fields)
+
+    def __getitem__(self, index: int) -> Training:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        fields = RECORD.unpack_from(self.records,
+                                    index % len(self) * RECORD.size)
+        return read_package(*unpack_record(*fields))
+
+    def as_array(self):
+        """Вернуть структурированный массив NumPy над записями файла."""
+        if np is None:
+            raise RuntimeError('Для представления записей нужен NumPy')
+        return np.frombuffer(self.records, dtype=RECORD_DTYPE)
+
+    def close(self) -> None:
+        """Освободить отображение; массивы над ним должны быть удалены."""
+        self.records.release()
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,125 @@
+import sys
+
+STDIN: str = '-'
+FORMATS: tuple[str, ...] = ('text', 'json', 'csv', 'columnar')
+CHUNK_SIZE: int = 4096
+RECV_SIZE: int = 1 << 16
+
+
+def parse_args(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='cli.py', description='Расчёт тренировок по пакетам датчиков.')
+    parser.add_argument('paths', nargs='*', default=[STDIN],
+                        help='файлы с пакетами, `-` — стандартный ввод')
+    parser.add_argument('--format', choices=FORMATS, default='text')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--serve', metavar='SOCKET',
+                      help='запустить фоновый процесс на Unix-сокете')
+    mode.add_argument('--connect', metavar='SOCKET',
+                      help='передать пакеты запущенному фоновому процессу')
+    args = parser.parse_args(argv)
+    if args.connect and args.format != 'text':
+        parser.error('фоновый процесс отвечает только в формате text')
+    return args
+
+
+def iter_lines(paths: list, binary: bool = False):
+    """Читать строки из файлов по очереди."""
+    for path in paths:
+        if path == STDIN:
+            yield from sys.stdin.buffer if binary else sys.stdin
+            continue
+        with open(path, 'rb' if binary else 'r',
+                  encoding=None if binary else 'utf-8') as source:
+            yield from source
+
+
+def report_error(reason) -> None:
+    """Сообщить об отклонённой строке в stderr, не прерывая расчёт."""
+    print(f'Ошибка: {reason}', file=sys.stderr)
+
+
+def iter_parsed(lines):
+    """Разобрать строки пакетов, пропуская нечитаемые."""
+    from stream import parse_packet
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            yield parse_packet(line)
+        except ValueError as error:
+            report_error(error)
+
+
+def compute(paths: list, output_format: str) -> None:
+    """Рассчитать пакеты в текущем процессе.
+
+    Некорректные пакеты отсеиваются так же, как в фоновом процессе;
+    причины пишутся в stderr.
+    """
+    from sinks import SINKS
+    from stream import iter_infos
+    from validate import Validator
+
+    validator = Validator(lambda reject: report_error(reject.reason))
+    out = sys.stdout.buffer if output_format == 'columnar' else sys.stdout
+    with SINKS[output_format](out, CHUNK_SIZE) as sink:
+        sink.write_many(iter_infos(validator.filter(
+            iter_parsed(iter_lines(paths)))))
+
+
+def serve(path: str) -> None:
+    """Запустить фоновый процесс, отвечающий на Unix-сокете."""
+    import asyncio
+
+    import server
+
+    asyncio.run(server.serve('', 0, unix_path=path))
+
+
+def connect(path: str, paths: list, out) -> None:
+    """Передать пакеты фоновому процессу и вывести его ответы."""
+    import socket
+    import threading
+
+    def send(connection) -> None:
+        chunk = bytearray()
+        for line in iter_lines(paths, binary=True):
+            line = line.strip()
+            if not line or line.startswith(b'#'):
+                continue
+            chunk += line + b'\n'
+            if len(chunk) >= RECV_SIZE:
+                connection.sendall(chunk)
+                chunk.clear()
+        connection.sendall(chunk)
+        connection.shutdown(socket.SHUT_WR)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        sender = threading.Thread(target=send, args=(connection,))
+        sender.start()
+        while data := connection.recv(RECV_SIZE):
+            out.write(data)
+        sender.join()
+    out.flush()
+
+
+def main(argv=None) -> int:
+    """Точка входа командной строки."""
+    args = parse_args(argv)
+    if args.serve:
+        serve(args.serve)
+    elif args.connect:
+        connect(args.connect, args.paths, sys.stdout.buffer)
+    else:
+        compute(args.paths, args.format)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import math
+import time
+from hashlib import blake2b
+from typing import Callable, Iterable, Iterator
+
+import homework
+
+WINDOW: float = 3600
+CAPACITY: int = 1_000_000
+ERROR_RATE: float = 0.001
+
+
+def _canonical(value) -> str:
+    try:
+        return repr(float(value))
+    except OverflowError:
+        return repr(value)
+
+
+def fingerprint(workout_type: str, data: Iterable) -> bytes:
+    """Отпечаток пакета: `[720, 1]` и `[720.0, 1.0]` совпадают."""
+    canonical = workout_type + ':' + ','.join(_canonical(value)
+                                              for value in data)
+    return blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
+
+class Repeat(homework.Training):
+    """Повтор пакета: нулевые показатели, чтобы итоги не удваивались."""
+
+    def __init__(self, training_type: str) -> None:
+        super().__init__(0, 0, 0)
+        self.training_type: str = training_type
+
+    def get_distance(self) -> float:
+        return 0.0
+
+    def get_mean_speed(self) -> float:
+        return 0.0
+
+    def get_spent_calories(self) -> float:
+        return 0.0
+
+    def show_training_info(self) -> homework.InfoMessage:
+        return homework.InfoMessage(self.training_type, 0.0, 0.0, 0.0, 0.0)
+
+
+class BloomFilter:
+    """Фильтр Блума над отпечатками пакетов."""
+
+    def __init__(self, capacity: int = CAPACITY,
+                 error_rate: float = ERROR_RATE) -> None:
+        self.size: int = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes: int = max(1, round(self.size / capacity * math.log(2)))
+        self.bits: bytearray = bytearray((self.size + 7) // 8)
+        self.count: int = 0
+
+    def _positions(self, key: bytes) -> Iterator[int]:
+        first = int.from_bytes(key[:8], 'little')
+        second = int.from_bytes(key[8:16], 'little') | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
+
+    def add(self, key: bytes) -> None:
+        """Добавить отпечаток."""
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+
+class Deduplicator:
+    """Отбрасывает повторы пакетов в пределах временного окна.
+
+    Два поколения фильтра Блума сменяются каждые `window` секунд или
+    при заполнении, поэтому пакет помнится от `window` до `2 * window`
+    секунд, а память ограничена двумя фильтрами. С вероятностью
+    около `error_rate` новый пакет может быть принят за повтор.
+    """
+
+    def __init__(self,
+                 window: float = WINDOW,
+                 capacity: int = CAPACITY,
+                 error_rate: float = ERROR_RATE,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.window: float = window
+        self.capacity: int = capacity
+        self.error_rate: float = error_rate
+        self.clock: Callable[[], float] = clock
+        self.current: BloomFilter = BloomFilter(capacity, error_rate)
+        self.previous: BloomFilter = BloomFilter(capacity, error_rate)
+        self.started: float = clock()
+        self.packets: int = 0
+        self.duplicates: int = 0
+
+    def _rotate(self) -> None:
+        now = self.clock()
+        if (now - self.started >= self.window
+                or self.current.count >= self.capacity):
+            self.previous = self.current
+            self.current = BloomFilter(self.capacity, self.error_rate)
+            self.started = now
+
+    def is_duplicate(self, workout_type: str, data: Iterable) -> bool:
+        """Проверить пакет и запомнить его."""
+        self._rotate()
+        self.packets += 1
+        key = fingerprint(workout_type, data)
+        if key in self.current or key in self.previous:
+            self.duplicates += 1
+            return True
+        self.current.add(key)
+        return False
+
+    def filter(self, packets: Iterable) -> Iterator[tuple[str, list]]:
+        """Пропустить дальше только новые пакеты."""
+        for workout_type, data in packets:
+            if not self.is_duplicate(workout_type, data):
+                yield workout_type, data
+
+    def read_package(self, workout_type: str,
+                     data: list) -> homework.Training:
+        """Замена `homework.read_package` без расчёта повторов.
+
+        Для повтора возвращается `Repeat` с нулевыми показателями: его
+        можно обработать как обычную тренировку, а вывод при желании
+        пропустить проверкой `isinstance(training, Repeat)`. Пакет
+        запоминается только после успешного создания тренировки, поэтому
+        некорректные пакеты вызывают исключение при каждом повторе.
+        """
+        training = homework.read_package(workout_type, data)
+        if self.is_duplicate(workout_type, data):
+            return Repeat(type(training).__name__)
+        return training
@@ -0,0 +1,162 @@
+import argparse
+import math
+import random
+import time
+from typing import Callable, Optional, Sequence
+
+import batch
+from bench import generate_package
+from homework import read_package
+
+REL_TOL: float = 1e-12
+ABS_TOL: float = 1e-9
+SEED: int = 0
+EDGE_SHARE: float = 0.3
+
+Metrics = tuple[float, float, float]
+Candidate = Callable[[Sequence], Sequence[Metrics]]
+CANDIDATES: dict[str, Candidate] = {}
+
+
+def register_candidate(name: str) -> Callable[[Candidate], Candidate]:
+    """Зарегистрировать альтернативную реализацию формул."""
+    def decorator(candidate: Candidate) -> Candidate:
+        CANDIDATES[name] = candidate
+        return candidate
+    return decorator
+
+
+def generate_edge_package(rng: random.Random) -> tuple:
+    """Сгенерировать пограничный пакет.
+
+    Для ходьбы число шагов целое, а длительность подбирается так, чтобы
+    `speed ** 2 / height` попадало в целое число с точностью до ulp:
+    там `//` расходится с `math.floor(speed ** 2 / height)`.
+    """
+    workout_type = rng.choice(('SWM', 'RUN', 'WLK'))
+    weight = rng.choice((1, 30, 250, rng.uniform(1, 300)))
+    if workout_type == 'WLK':
+        height = rng.choice((50, 100, 180, 250, rng.randint(50, 250)))
+        action = rng.randint(1000, 50000)
+        duration = (action * 0.65 / 1000
+                    / math.sqrt(rng.randint(1, 40) * height))
+        duration = rng.choice((duration, math.nextafter(duration, 0),
+                               math.nextafter(duration, math.inf)))
+        return workout_type, [action, duration, weight, height]
+    duration = rng.choice((1e-3, 0.01, 0.5, 1, 24, rng.uniform(1e-3, 48)))
+    action = rng.choice((0, 1, 10 ** 6, rng.randint(0, 10 ** 5)))
+    if workout_type == 'SWM':
+        return workout_type, [action, duration, weight,
+                              rng.choice((10, 25, 50)),
+                              rng.choice((0, 1, 1000, rng.randint(0, 200)))]
+    return workout_type, [action, duration, weight]
+
+
+def generate_packages(size: int, seed: int = SEED,
+                      edge_share: float = EDGE_SHARE) -> list:
+    """Смесь правдоподобных и пограничных пакетов."""
+    rng = random.Random(seed)
+    packages = []
+    for _ in range(size):
+        if rng.random() < edge_share:
+            packages.append(generate_edge_package(rng))
+        else:
+            packages.append(generate_package(
+                rng.choice(('SWM', 'RUN', 'WLK')), rng))
+    return packages
+
+
+def reference(packages: Sequence) -> list[Metrics]:
+    """Эталон: `Training.show_training_info`."""
+    result = []
+    for workout_type, data in packages:
+        info = read_package(workout_type, data).show_training_info()
+        result.append((info.distance, info.speed, info.calories))
+    return result
+
+
+@register_candidate('closed_form')
+def closed_form(packages: Sequence) -> list[Metrics]:
+    """Формулы в замкнутом виде без создания объектов."""
+    result = []
+    for workout_type, data in packages:
+        action, duration, weight, *extra = data
+        if workout_type == 'SWM':
+            distance = action * 1.38 / 1000
+            speed = extra[0] * extra[1] / 1000 / duration
+            calories = (speed + 1.1) * 2 * weight
+        else:
+            distance = action * 0.65 / 1000
+            speed = distance / duration
+            if workout_type == 'RUN':
+                calories = ((18 * speed - 20) * weight / 1000
+                            * (duration * 60))
+            else:
+                calories = ((0.035 * weight
+                            + (speed**2 // extra[0]) * 0.029 * weight)
+                            * (duration * 60))
+        result.append((distance, speed, calories))
+    return result
+
+
+@register_candidate('batch_python')
+def batch_python(packages: Sequence) -> list[Metrics]:
+    """Колоночный движок `batch` без NumPy."""
+    result = batch.compute_batch(**batch.packages_to_columns(packages),
+                                 use_numpy=False)
+    return list(zip(*result))
+
+
+if batch.np is not None:
+    @register_candidate('batch_numpy')
+    def batch_numpy(packages: Sequence) -> list[Metrics]:
+        """Колоночный движок `batch` на NumPy."""
+        result = batch.compute_batch(**batch.packages_to_columns(packages))
+        return list(zip(*(column.tolist() for column in result)))
+
+
+def mismatches(expected: Sequence[Metrics], actual: Sequence[Metrics],
+               packages: Sequence, rel_tol: float = REL_TOL,
+               abs_tol: float = ABS_TOL) -> list[tuple]:
+    """Найти пакеты, на которых реализация расходится с эталоном."""
+    if len(expected) != len(actual):
+        return [('length', len(expected), len(actual))]
+    return [(package, wanted, got)
+            for package, wanted, got in zip(packages, expected, actual)
+            if not all(math.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
+                       for a, b in zip(wanted, got))]
+
+
+def _timed(function: Callable, packages: Sequence) -> tuple[list, float]:
+    started = time.perf_counter()
+    result = function(packages)
+    return result, time.perf_counter() - started
+
+
+def run(size: int = 10000, seed: int = SEED,
+        candidates: Optional[dict[str, Candidate]] = None) -> list[dict]:
+    """Сверить кандидатов с эталоном и замерить их ускорение."""
+    packages = generate_packages(size, seed)
+    expected, reference_seconds = _timed(reference, packages)
+    report = []
+    for name, candidate in (candidates or CANDIDATES).items():
+        actual, seconds = _timed(candidate, packages)
+        report.append({
+            'candidate': name,
+            'mismatches': mismatches(expected, actual, packages),
+            'reference_seconds': reference_seconds,
+            'candidate_seconds': seconds,
+            'speedup': reference_seconds / seconds if seconds else math.inf,
+        })
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Сверка быстрых реализаций с классами тренировок.')
+    parser.add_argument('--size', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=SEED)
+    args = parser.parse_args()
+    for row in run(args.size, args.seed):
+        print(f'{row["candidate"]}: расхождений {len(row["mismatches"])}; '
+              f'ускорение x{row["speedup"]:.2f}')
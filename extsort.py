@@ -0,0 +1,130 @@
+import argparse
+import heapq
+import json
+import os
+import pickle
+import sys
+import tempfile
+from typing import Callable, Iterable, Iterator, Optional
+
+from aggregate import Totals
+from homework import read_package
+from stream import parse_athlete_packet
+
+KEYS: dict[str, Callable[[str, str], tuple]] = {
+    'type': lambda athlete, training_type: (training_type,),
+    'athlete': lambda athlete, training_type: (athlete,),
+    'athlete_type': lambda athlete, training_type: (athlete, training_type),
+}
+MEMORY_LIMIT: int = 64 * 1024 * 1024
+ENTRY_BYTES: int = 400
+SPILL_BLOCK: int = 4096
+PROGRESS_EVERY: int = 100000
+
+
+def _spill(groups: dict, directory: str, runs: list) -> None:
+    """Записать отсортированные частичные итоги во временный файл."""
+    path = os.path.join(directory, f'run-{len(runs)}.pickle')
+    items = sorted((key, (totals.count, totals.duration, totals.distance,
+                          totals.calories))
+                   for key, totals in groups.items())
+    with open(path, 'wb') as run:
+        for start in range(0, len(items), SPILL_BLOCK):
+            pickle.dump(items[start:start + SPILL_BLOCK], run,
+                        pickle.HIGHEST_PROTOCOL)
+    runs.append(path)
+    groups.clear()
+
+
+def _read_run(path: str) -> Iterator[tuple]:
+    with open(path, 'rb') as run:
+        while True:
+            try:
+                yield from pickle.load(run)
+            except EOFError:
+                return
+
+
+def _combine(items: Iterable[tuple]) -> Iterator[tuple[tuple, Totals]]:
+    """Сложить соседние частичные итоги с одинаковым ключом."""
+    current_key, current = None, None
+    for key, (count, duration, distance, calories) in items:
+        if key != current_key:
+            if current is not None:
+                yield current_key, current
+            current_key, current = key, Totals()
+        current.count += count
+        current.duration += duration
+        current.distance += distance
+        current.calories += calories
+    if current is not None:
+        yield current_key, current
+
+
+def group_by(lines: Iterable[str],
+             key: str = 'type',
+             memory_limit: int = MEMORY_LIMIT,
+             directory: Optional[str] = None,
+             progress: Optional[Callable[[dict], None]] = None,
+             progress_every: int = PROGRESS_EVERY
+             ) -> Iterator[tuple[tuple, dict]]:
+    """Сгруппировать тренировки, не держа все результаты в памяти.
+
+    Строки вида `athlete CODE поля...` рассчитываются по мере чтения.
+    Частичные итоги копятся в словаре до `memory_limit` байт (оценка
+    `ENTRY_BYTES` на группу), затем сбрасываются на диск отсортированными
+    прогонами, которые в конце сливаются через `heapq.merge`.
+    """
+    group_key = KEYS[key]
+    max_groups = max(1, memory_limit // ENTRY_BYTES)
+    groups: dict[tuple, Totals] = {}
+    runs: list[str] = []
+    state = {'packets': 0, 'runs': 0, 'groups': 0}
+    with tempfile.TemporaryDirectory(dir=directory) as temporary:
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            athlete, workout_type, data = parse_athlete_packet(line)
+            info = read_package(workout_type, data).show_training_info()
+            group = group_key(athlete, info.training_type)
+            if group not in groups:
+                if len(groups) >= max_groups:
+                    _spill(groups, temporary, runs)
+                groups[group] = Totals()
+            groups[group].add(info)
+            state['packets'] += 1
+            if progress is not None and not state['packets'] % progress_every:
+                state['runs'] = len(runs)
+                progress(dict(state))
+        _spill(groups, temporary, runs)
+        state['runs'] = len(runs)
+        for group, totals in _combine(heapq.merge(
+                *(_read_run(path) for path in runs))):
+            state['groups'] += 1
+            yield group, totals.snapshot()
+        if progress is not None:
+            progress(dict(state))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Группировка тренировок с выгрузкой на диск.')
+    parser.add_argument('path', nargs='?', default='-')
+    parser.add_argument('--key', choices=KEYS, default='type')
+    parser.add_argument('--memory-limit', type=int, default=MEMORY_LIMIT,
+                        help='предел памяти под группы, байт')
+    parser.add_argument('--tmp-dir', default=None)
+    args = parser.parse_args()
+
+    def report(state: dict) -> None:
+        print(f'Пакетов: {state["packets"]}; прогонов: {state["runs"]}; '
+              f'групп: {state["groups"]}', file=sys.stderr)
+
+    source = (sys.stdin if args.path == '-'
+              else open(args.path, encoding='utf-8'))
+    with source:
+        for group, totals in group_by(source, args.key, args.memory_limit,
+                                      args.tmp_dir, report):
+            print(json.dumps({'group': group, **totals},
+                             ensure_ascii=False))
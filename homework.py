@@ -1,4 +1,10 @@
-from dataclasses import asdict, dataclass
+import inspect
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable
+
+MESSAGE_CACHE_SIZE: int = 4096
+INFO_CACHE_SIZE: int = 65536
 
 
 @dataclass
@@ -16,7 +22,32 @@ class InfoMessage:
                'Потрачено ккал: {calories:.3f}.')
 
     def get_message(self) -> str:
-        return self.MESSAGE.format(**asdict(self))
+        return self.MESSAGE.format(training_type=self.training_type,
+                                   duration=self.duration,
+                                   distance=self.distance,
+                                   speed=self.speed,
+                                   calories=self.calories)
+
+
+@lru_cache(maxsize=MESSAGE_CACHE_SIZE)
+def _cached_message(training_type: str,
+                    duration: float,
+                    distance: float,
+                    speed: float,
+                    calories: float) -> str:
+    return InfoMessage(training_type, duration, distance,
+                       speed, calories).get_message()
+
+
+def get_cached_message(info: InfoMessage) -> str:
+    """Получить сообщение из кэша для повторяющихся тренировок."""
+    return _cached_message(info.training_type, info.duration,
+                           info.distance, info.speed, info.calories)
+
+
+def format_many(messages: Iterable[InfoMessage]) -> str:
+    """Собрать сообщения в одну строку для однократной записи."""
+    return '\n'.join([message.get_message() for message in messages])
 
 
 class Training:
@@ -51,6 +82,54 @@ class Training:
                            self.get_spent_calories())
 
 
+@dataclass(frozen=True)
+class WorkoutSchema:
+    """Описание вида тренировки в реестре."""
+    code: str
+    training: type[Training]
+    fields: tuple[str, ...]
+
+    @property
+    def arity(self) -> int:
+        return len(self.fields)
+
+    def accepts(self, data: list) -> bool:
+        """Проверить число полей пакета без создания тренировки."""
+        return len(data) == self.arity
+
+
+WORKOUT_TYPES: dict[str, WorkoutSchema] = {}
+_CONSTRUCTORS: dict[str, type[Training]] = {}
+
+
+def _packet_fields(training: type[Training]) -> tuple[str, ...]:
+    """Имена полей пакета по сигнатуре конструктора."""
+    try:
+        parameters = inspect.signature(training).parameters.values()
+    except (TypeError, ValueError):
+        parameters = None
+    if parameters is None or any(
+            parameter.kind not in (parameter.POSITIONAL_ONLY,
+                                   parameter.POSITIONAL_OR_KEYWORD)
+            for parameter in parameters):
+        raise ValueError(f'Конструктор {training.__name__} должен принимать '
+                         'только позиционные поля пакета')
+    return tuple(parameter.name for parameter in parameters)
+
+
+def register(code: str) -> Callable[[type[Training]], type[Training]]:
+    """Зарегистрировать вид тренировки под кодом пакета."""
+    def decorator(training: type[Training]) -> type[Training]:
+        if code in WORKOUT_TYPES:
+            raise ValueError(f'Код тренировки {code} уже занят')
+        fields = _packet_fields(training)
+        WORKOUT_TYPES[code] = WorkoutSchema(code, training, fields)
+        _CONSTRUCTORS[code] = training
+        return training
+    return decorator
+
+
+@register('RUN')
 class Running(Training):
     """Тренировка: бег."""
     CORRECTION_COEFFICIENT_1: float = 18
@@ -68,6 +147,7 @@ class Running(Training):
                 * (self.duration_in_hours * self.MINUTES_IN_HOUR))
 
 
+@register('WLK')
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
     CORRECTION_COEFFICIENT_1: float = 0.035
@@ -90,6 +170,7 @@ class SportsWalking(Training):
                 * (self.duration_in_hours * self.MINUTES_IN_HOUR))
 
 
+@register('SWM')
 class Swimming(Training):
     """Тренировка: плавание."""
     LEN_STEP: float = 1.38
@@ -121,16 +202,34 @@ class Swimming(Training):
 
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    table: dict[str, type[Training]] = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking,
-    }
-
-    if workout_type not in table:
+    if workout_type not in _CONSTRUCTORS:
         raise ValueError('Нет такого вида тренировки')
     else:
-        return table[workout_type](*data)
+        return _CONSTRUCTORS[workout_type](*data)
+
+
+@lru_cache(maxsize=INFO_CACHE_SIZE)
+def _cached_training_info(workout_type: str, data: tuple) -> InfoMessage:
+    return read_package(workout_type, data).show_training_info()
+
+
+def read_training_info(workout_type: str, data: list) -> InfoMessage:
+    """Получить результат тренировки через общий кэш пакетов.
+
+    Повторные пакеты возвращают один и тот же объект `InfoMessage`,
+    поэтому изменять его нельзя.
+    """
+    return _cached_training_info(workout_type, tuple(data))
+
+
+def training_info_cache_info():
+    """Вернуть попадания, промахи и размер кэша пакетов."""
+    return _cached_training_info.cache_info()
+
+
+def clear_training_info_cache() -> None:
+    """Очистить кэш пакетов."""
+    _cached_training_info.cache_clear()
 
 
 def main(training: Training) -> None:
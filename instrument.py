@@ -0,0 +1,256 @@
+import cProfile
+import json
+import pstats
+import time
+from functools import wraps
+from typing import Callable, Optional
+
+import homework
+
+SUB_BUCKET_BITS: int = 5
+ERROR: str = 'error'
+
+
+class LatencyHistogram:
+    """Лог-линейная гистограмма задержек в наносекундах (как HDR).
+
+    Относительная погрешность значения корзины не больше
+    `1 / 2 ** (SUB_BUCKET_BITS - 1)`, то есть 6.25%.
+    """
+    __slots__ = ('counts', 'count', 'total')
+    HALF: int = 1 << (SUB_BUCKET_BITS - 1)
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count: int = 0
+        self.total: int = 0
+
+    @classmethod
+    def index(cls, value: int) -> int:
+        """Номер корзины для значения."""
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        if shift <= 0:
+            return value
+        return shift * cls.HALF + (value >> shift)
+
+    @classmethod
+    def upper_bound(cls, index: int) -> int:
+        """Наибольшее значение, попадающее в корзину."""
+        if index < 2 * cls.HALF:
+            return index
+        shift = index // cls.HALF - 1
+        return ((index % cls.HALF + cls.HALF + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Учесть одно измерение."""
+        index = self.index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+
+    def percentile(self, share: float) -> int:
+        """Вернуть оценку перцентиля сверху."""
+        if not self.count:
+            return 0
+        rank = share * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return self.upper_bound(index)
+        return self.upper_bound(max(self.counts))
+
+    def buckets(self) -> list[tuple[int, int]]:
+        """Вернуть пары (верхняя граница, накопленное число)."""
+        result = []
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            result.append((self.upper_bound(index), seen))
+        return result
+
+
+class Instrumentation:
+    """Счётчики и гистограммы задержек по этапам и видам тренировок."""
+
+    def __init__(self) -> None:
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self.originals: list[tuple[object, str, object]] = []
+        self.profile: Optional['PacketProfile'] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.originals)
+
+    def record(self, stage: str, workout: str, elapsed: int) -> None:
+        """Учесть длительность этапа в наносекундах."""
+        key = (stage, workout)
+        if key not in self.histograms:
+            self.histograms[key] = LatencyHistogram()
+        self.histograms[key].record(elapsed)
+
+    def reset(self) -> None:
+        """Сбросить накопленную статистику."""
+        self.histograms.clear()
+
+    def _patch(self, owner: object, name: str, wrapper: Callable) -> None:
+        self.originals.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, wraps(owner.__dict__[name])(wrapper))
+
+    def enable(self) -> None:
+        """Подменить этапы обработки пакета замеряющими обёртками.
+
+        Этап `read_package` замеряется в общей таблице конструкторов
+        `homework._CONSTRUCTORS`, поэтому учитываются и модули,
+        импортировавшие `read_package` напрямую. Методы подменяются в
+        классах; при выключенных замерах оригиналы возвращаются на место,
+        поэтому накладных расходов нет.
+        """
+        if self.enabled:
+            return
+        for code, training in list(homework._CONSTRUCTORS.items()):
+            self.originals.append((homework._CONSTRUCTORS, code, training))
+            homework._CONSTRUCTORS[code] = self._timed_constructor(training)
+        self._patch(homework, 'main',
+                    self._timed_method('main', homework.main))
+        self._patch(homework.Training, 'show_training_info',
+                    self._timed_method('show_training_info',
+                                       homework.Training.show_training_info))
+        self._patch(homework.InfoMessage, 'get_message', self._timed_message(
+            homework.InfoMessage.get_message))
+        for schema in homework.WORKOUT_TYPES.values():
+            method = schema.training.__dict__.get('get_spent_calories')
+            if method is not None:
+                self._patch(schema.training, 'get_spent_calories',
+                            self._timed_method('get_spent_calories', method))
+
+    def disable(self) -> None:
+        """Вернуть исходные функции и методы."""
+        while self.originals:
+            owner, name, original = self.originals.pop()
+            if isinstance(owner, dict):
+                owner[name] = original
+            else:
+                setattr(owner, name, original)
+
+    def _timed_constructor(self, training: type) -> Callable:
+        clock = time.perf_counter_ns
+        workout = training.__name__
+
+        def construct(*data):
+            started = clock()
+            try:
+                result = training(*data)
+            except Exception:
+                self.record('read_package', ERROR, clock() - started)
+                raise
+            self.record('read_package', workout, clock() - started)
+            if self.profile is not None:
+                self.profile.tick()
+            return result
+        return construct
+
+    def _timed_method(self, stage: str, original: Callable) -> Callable:
+        clock = time.perf_counter_ns
+
+        def method(training):
+            started = clock()
+            result = original(training)
+            self.record(stage, type(training).__name__, clock() - started)
+            return result
+        return method
+
+    def _timed_message(self, original: Callable) -> Callable:
+        clock = time.perf_counter_ns
+
+        def get_message(info):
+            started = clock()
+            result = original(info)
+            self.record('get_message', info.training_type, clock() - started)
+            return result
+        return get_message
+
+    def snapshot(self) -> list[dict]:
+        """Вернуть статистику по этапам в виде списка словарей."""
+        return [{
+            'stage': stage,
+            'workout': workout,
+            'count': histogram.count,
+            'total_ns': histogram.total,
+            'p50_ns': histogram.percentile(0.5),
+            'p95_ns': histogram.percentile(0.95),
+            'p99_ns': histogram.percentile(0.99),
+            'max_ns': histogram.percentile(1),
+        } for (stage, workout), histogram in sorted(self.histograms.items())]
+
+    def export_json(self) -> str:
+        """Выгрузить статистику в JSON."""
+        return json.dumps(self.snapshot(), ensure_ascii=False)
+
+    def export_prometheus(self) -> str:
+        """Выгрузить статистику в текстовом формате Prometheus."""
+        name = 'homework_stage_latency_seconds'
+        lines = [f'# HELP {name} Длительность этапов обработки пакета.',
+                 f'# TYPE {name} histogram']
+        for (stage, workout), histogram in sorted(self.histograms.items()):
+            labels = f'stage="{stage}",workout="{workout}"'
+            for bound, seen in histogram.buckets():
+                lines.append(f'{name}_bucket{{{labels},le="{bound / 1e9}"}} '
+                             f'{seen}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} '
+                         f'{histogram.count}')
+            lines.append(f'{name}_sum{{{labels}}} {histogram.total / 1e9}')
+            lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+class PacketProfile:
+    """Профилировать cProfile следующие `packets` пакетов."""
+
+    def __init__(self, instrumentation: Instrumentation,
+                 packets: int) -> None:
+        self.instrumentation: Instrumentation = instrumentation
+        self.remaining: int = packets
+        self.profiler: cProfile.Profile = cProfile.Profile()
+        self._enabled_here: bool = False
+
+    def __enter__(self) -> 'PacketProfile':
+        if not self.instrumentation.enabled:
+            self.instrumentation.enable()
+            self._enabled_here = True
+        self.instrumentation.profile = self
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+        if self._enabled_here:
+            self.instrumentation.disable()
+
+    def tick(self) -> None:
+        """Отметить обработанный пакет."""
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.stop()
+
+    def stop(self) -> None:
+        """Остановить профилирование."""
+        self.profiler.disable()
+        if self.instrumentation.profile is self:
+            self.instrumentation.profile = None
+
+    def stats(self) -> pstats.Stats:
+        """Вернуть собранный профиль."""
+        return pstats.Stats(self.profiler)
+
+
+INSTRUMENTATION = Instrumentation()
+enable = INSTRUMENTATION.enable
+disable = INSTRUMENTATION.disable
+export_json = INSTRUMENTATION.export_json
+export_prometheus = INSTRUMENTATION.export_prometheus
+
+
+def profile_packets(packets: int) -> PacketProfile:
+    """Включить cProfile на ближайшие `packets` пакетов."""
+    return PacketProfile(INSTRUMENTATION, packets)
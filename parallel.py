@@ -0,0 +1,80 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TextIO
+
+from homework import format_many
+from stream import StreamStats, iter_infos, iter_packets
+
+CHUNK_SIZE: int = 10000
+
+
+def iter_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[list]:
+    """Разбить источник строк на блоки по `chunk_size` строк."""
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_chunk(lines: list) -> tuple[int, str]:
+    """Рассчитать блок пакетов в процессе-обработчике."""
+    infos = list(iter_infos(iter_packets(lines)))
+    return len(infos), format_many(infos)
+
+
+def run(source: Iterable[str],
+        out: TextIO,
+        workers: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE) -> StreamStats:
+    """Обработать пакеты в пуле процессов, сохраняя порядок вывода."""
+    stats = StreamStats()
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        max_pending = 2 * workers
+        for chunk in iter_chunks(source, chunk_size):
+            pending.append(executor.submit(process_chunk, chunk))
+            if len(pending) >= max_pending:
+                stats.packets += _write_result(pending.popleft(), out)
+        while pending:
+            stats.packets += _write_result(pending.popleft(), out)
+    out.flush()
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def _write_result(future, out: TextIO) -> int:
+    count, text = future.result()
+    if count:
+        out.write(text + '\n')
+    return count
+
+
+def process_file(path: str,
+                 out: TextIO,
+                 workers: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE) -> StreamStats:
+    """Обработать файл с пакетами на нескольких ядрах."""
+    with open(path, encoding='utf-8') as source:
+        return run(source, out, workers, chunk_size)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Параллельная обработка файла с пакетами.')
+    parser.add_argument('path')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+    stats = process_file(args.path, sys.stdout, args.workers,
+                         args.chunk_size)
+    print(f'Обработано пакетов: {stats.packets}; '
+          f'{stats.packets_per_sec:.0f} пакетов/с.', file=sys.stderr)
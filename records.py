@@ -0,0 +1,187 @@
+from array import array
+from typing import Iterator
+
+import homework
+
+
+class InfoMessage:
+    """Информационное сообщение о тренировке без `__dict__`."""
+    __slots__ = ('training_type', 'duration', 'distance', 'speed',
+                 'calories')
+    MESSAGE = homework.InfoMessage.MESSAGE
+
+    def __init__(self,
+                 training_type: str,
+                 duration: float,
+                 distance: float,
+                 speed: float,
+                 calories: float) -> None:
+        self.training_type: str = training_type
+        self.duration: float = duration
+        self.distance: float = distance
+        self.speed: float = speed
+        self.calories: float = calories
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}'
+                           for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    get_message = homework.InfoMessage.get_message
+
+
+class Training:
+    """Базовый класс тренировки без `__dict__`."""
+    __slots__ = ('action_in_steps', 'duration_in_hours', 'weight_in_kg')
+    LEN_STEP: float = homework.Training.LEN_STEP
+    M_IN_KM: float = homework.Training.M_IN_KM
+    MINUTES_IN_HOUR: float = homework.Training.MINUTES_IN_HOUR
+
+    __init__ = homework.Training.__init__
+    get_distance = homework.Training.get_distance
+    get_mean_speed = homework.Training.get_mean_speed
+    get_spent_calories = homework.Training.get_spent_calories
+
+    def show_training_info(self) -> InfoMessage:
+        """Вернуть информационное сообщение о выполненной тренировке."""
+        return InfoMessage(type(self).__name__,
+                           self.duration_in_hours,
+                           self.get_distance(),
+                           self.get_mean_speed(),
+                           self.get_spent_calories())
+
+
+class Running(Training):
+    """Тренировка: бег."""
+    __slots__ = ()
+    CORRECTION_COEFFICIENT_1: float = homework.Running.CORRECTION_COEFFICIENT_1
+    CORRECTION_COEFFICIENT_2: float = homework.Running.CORRECTION_COEFFICIENT_2
+
+    get_spent_calories = homework.Running.get_spent_calories
+
+
+class SportsWalking(Training):
+    """Тренировка: спортивная ходьба."""
+    __slots__ = ('height_in_cm',)
+    CORRECTION_COEFFICIENT_1: float = (
+        homework.SportsWalking.CORRECTION_COEFFICIENT_1)
+    CORRECTION_COEFFICIENT_2: float = (
+        homework.SportsWalking.CORRECTION_COEFFICIENT_2)
+
+    def __init__(self,
+                 action: int,
+                 duration: float,
+                 weight: float,
+                 height: float):
+        Training.__init__(self, action, duration, weight)
+        self.height_in_cm: float = height
+
+    get_spent_calories = homework.SportsWalking.get_spent_calories
+
+
+class Swimming(Training):
+    """Тренировка: плавание."""
+    __slots__ = ('length_pool_in_meters', 'count_pool')
+    LEN_STEP: float = homework.Swimming.LEN_STEP
+    CORRECTION_COEFFICIENT_1: float = (
+        homework.Swimming.CORRECTION_COEFFICIENT_1)
+    CORRECTION_COEFFICIENT_2: float = (
+        homework.Swimming.CORRECTION_COEFFICIENT_2)
+
+    def __init__(self,
+                 action: int,
+                 duration: float,
+                 weight: float,
+                 length_pool: float,
+                 count_pool: float):
+        Training.__init__(self, action, duration, weight)
+        self.length_pool_in_meters: float = length_pool
+        self.count_pool: float = count_pool
+
+    get_mean_speed = homework.Swimming.get_mean_speed
+    get_spent_calories = homework.Swimming.get_spent_calories
+
+
+TYPES: dict[str, type[Training]] = {
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking,
+}
+
+
+def read_package(workout_type: str, data: list) -> Training:
+    """Прочитать данные датчиков в компактную тренировку."""
+    if workout_type not in TYPES:
+        raise ValueError('Нет такого вида тренировки')
+    else:
+        return TYPES[workout_type](*data)
+
+
+class TrainingBatch:
+    """Хранилище тренировок по колонкам на основе `array.array`."""
+    CODES: tuple[str, ...] = ('SWM', 'RUN', 'WLK')
+    TYPES: dict[str, type[Training]] = TYPES
+    NUMERIC_COLUMNS: tuple[str, ...] = ('action', 'duration', 'weight',
+                                        'height', 'length_pool', 'count_pool')
+
+    def __init__(self) -> None:
+        self.codes: array = array('B')
+        self.action: array = array('d')
+        self.duration: array = array('d')
+        self.weight: array = array('d')
+        self.height: array = array('d')
+        self.length_pool: array = array('d')
+        self.count_pool: array = array('d')
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Training]:
+        return (self[index] for index in range(len(self)))
+
+    def __getitem__(self, index: int) -> Training:
+        workout_type = self.CODES[self.codes[index]]
+        args = [self.action[index],
+                self.duration[index],
+                self.weight[index]]
+        if workout_type == 'WLK':
+            args.append(self.height[index])
+        elif workout_type == 'SWM':
+            args.extend((self.length_pool[index], self.count_pool[index]))
+        return self.TYPES[workout_type](*args)
+
+    def append(self, workout_type: str, data: list) -> None:
+        """Добавить пакет данных датчиков.
+
+        Поля проверяются до записи, поэтому при ошибке колонки остаются
+        одной длины.
+        """
+        if workout_type not in self.TYPES:
+            raise ValueError('Нет такого вида тренировки')
+        if not homework.WORKOUT_TYPES[workout_type].accepts(data):
+            raise ValueError('Неверное число полей пакета')
+        action, duration, weight, *extra = data
+        height = extra[0] if workout_type == 'WLK' else 0
+        length_pool, count_pool = extra if workout_type == 'SWM' else (0, 0)
+        row = array('d', (action, duration, weight, height,
+                          length_pool, count_pool))
+        self.codes.append(self.CODES.index(workout_type))
+        for column, value in zip(self.NUMERIC_COLUMNS, row):
+            getattr(self, column).append(value)
+
+    def extend(self, packages) -> None:
+        """Добавить несколько пакетов данных датчиков."""
+        for workout_type, data in packages:
+            self.append(workout_type, data)
+
+    def columns(self) -> dict:
+        """Вернуть колонки в формате `batch.compute_batch`."""
+        return {
+            'workout_type': [self.CODES[code] for code in self.codes],
+            'action': self.action,
+            'duration': self.duration,
+            'weight': self.weight,
+            'height': self.height,
+            'length_pool': self.length_pool,
+            'count_pool': self.count_pool,
+        }
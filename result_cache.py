@@ -0,0 +1,99 @@
+import json
+import sqlite3
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Iterable
+
+from homework import WORKOUT_TYPES, InfoMessage, WorkoutSchema, read_package
+
+QUERY_BATCH: int = 500
+SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    training_type TEXT NOT NULL,
+    duration REAL NOT NULL,
+    distance REAL NOT NULL,
+    speed REAL NOT NULL,
+    calories REAL NOT NULL
+) WITHOUT ROWID
+'''
+
+
+@lru_cache(maxsize=None)
+def class_signature(schema: WorkoutSchema) -> str:
+    """Имя класса и все его коэффициенты (`LEN_STEP`, `M_IN_KM`, ...).
+
+    Считается один раз на процесс: формулы меняются правкой кода.
+    """
+    training = schema.training
+    coefficients = {name: getattr(training, name) for name in dir(training)
+                    if name.isupper()}
+    return json.dumps([training.__qualname__, coefficients], sort_keys=True)
+
+
+def packet_key(workout_type: str, data: Iterable) -> str:
+    """Ключ пакета, меняющийся при смене формул его вида тренировки."""
+    schema = WORKOUT_TYPES.get(workout_type)
+    if schema is None:
+        raise ValueError('Нет такого вида тренировки')
+    canonical = json.dumps([workout_type, class_signature(schema),
+                            [float(value) for value in data]])
+    return blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Постоянный кэш результатов тренировок в SQLite."""
+
+    def __init__(self, path: str) -> None:
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        self.connection.execute(SCHEMA)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __enter__(self) -> 'ResultCache':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _lookup(self, keys: list[str]) -> dict[str, InfoMessage]:
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), QUERY_BATCH):
+            chunk = unique[start:start + QUERY_BATCH]
+            placeholders = ','.join('?' * len(chunk))
+            for key, *fields in self.connection.execute(
+                    'SELECT key, training_type, duration, distance, speed, '
+                    f'calories FROM results WHERE key IN ({placeholders})',
+                    chunk):
+                found[key] = InfoMessage(*fields)
+        return found
+
+    def get_many(self, packages: Iterable) -> list[InfoMessage]:
+        """Вернуть результаты пакетов, рассчитав только отсутствующие."""
+        packages = list(packages)
+        keys = [packet_key(workout_type, data)
+                for workout_type, data in packages]
+        found = self._lookup(keys)
+        computed = {}
+        for key, (workout_type, data) in zip(keys, packages):
+            if key not in found and key not in computed:
+                computed[key] = read_package(
+                    workout_type, data).show_training_info()
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)',
+                [(key, info.training_type, info.duration, info.distance,
+                  info.speed, info.calories)
+                 for key, info in computed.items()])
+        self.misses += len(computed)
+        self.hits += len(keys) - len(computed)
+        found.update(computed)
+        return [found[key] for key in keys]
+
+    def get(self, workout_type: str, data: list) -> InfoMessage:
+        """Вернуть результат одного пакета."""
+        return self.get_many([(workout_type, data)])[0]
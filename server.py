@@ -0,0 +1,160 @@
+import argparse
+import asyncio
+import signal
+from typing import Optional
+
+from homework import read_package
+from stream import parse_packet
+from validate import check_packet
+
+MAX_BATCH: int = 512
+BATCH_DELAY: float = 0.001
+QUEUE_SIZE: int = 8192
+CONNECTION_QUEUE_SIZE: int = 256
+STOP = None
+
+
+def compute_message(line: str) -> str:
+    """Рассчитать строку пакета и вернуть строку ответа."""
+    try:
+        workout_type, data = parse_packet(line)
+    except ValueError as error:
+        return f'Ошибка: {error}'
+    reject = check_packet(workout_type, data)
+    if reject is not None:
+        return f'Ошибка: {reject.reason}'
+    return read_package(workout_type, data).show_training_info().get_message()
+
+
+class TrainingServer:
+    """Asyncio-сервер, рассчитывающий пакеты по строкам."""
+
+    def __init__(self,
+                 max_batch: int = MAX_BATCH,
+                 batch_delay: float = BATCH_DELAY,
+                 queue_size: int = QUEUE_SIZE) -> None:
+        self.max_batch: int = max_batch
+        self.batch_delay: float = batch_delay
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.connections: set = set()
+        self.batches: int = 0
+        self.packets: int = 0
+        self._batcher: Optional[asyncio.Task] = None
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0):
+        """Начать приём TCP-соединений."""
+        self.server = await asyncio.start_server(self._handle, host, port)
+        self._start_batcher()
+        return self.server
+
+    async def start_unix(self, path: str):
+        """Начать приём соединений на Unix-сокете."""
+        self.server = await asyncio.start_unix_server(self._handle, path)
+        self._start_batcher()
+        return self.server
+
+    def _start_batcher(self) -> None:
+        self._batcher = asyncio.create_task(self._run_batcher())
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """Перестать принимать соединения и дообработать очередь."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.connections:
+            await asyncio.wait(self.connections, timeout=timeout)
+        for task in self.connections:
+            task.cancel()
+        await self.queue.put(STOP)
+        if self._batcher is not None:
+            await self._batcher
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self.connections.add(task)
+        responses: asyncio.Queue = asyncio.Queue(CONNECTION_QUEUE_SIZE)
+        responder = asyncio.create_task(self._respond(responses, writer))
+        try:
+            async for line in reader:
+                line = line.decode('utf-8').strip()
+                if not line:
+                    continue
+                future = asyncio.get_running_loop().create_future()
+                await responses.put(future)
+                await self.queue.put((line, future))
+        except ConnectionError:
+            pass
+        finally:
+            await responses.put(STOP)
+            await responder
+            writer.close()
+            self.connections.discard(task)
+
+    async def _respond(self, responses: asyncio.Queue,
+                       writer: asyncio.StreamWriter) -> None:
+        """Писать ответы по порядку; после разрыва только разбирать очередь."""
+        connected = True
+        while (future := await responses.get()) is not STOP:
+            message = await future
+            if not connected:
+                continue
+            try:
+                writer.write((message + '\n').encode('utf-8'))
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+
+    async def _run_batcher(self) -> None:
+        while True:
+            item = await self.queue.get()
+            if item is STOP:
+                return
+            batch = [item]
+            if self.batch_delay:
+                await asyncio.sleep(self.batch_delay)
+            while len(batch) < self.max_batch and not self.queue.empty():
+                item = self.queue.get_nowait()
+                if item is STOP:
+                    self._compute(batch)
+                    return
+                batch.append(item)
+            self._compute(batch)
+
+    def _compute(self, batch: list) -> None:
+        self.batches += 1
+        self.packets += len(batch)
+        for line, future in batch:
+            if future.done():
+                continue
+            try:
+                future.set_result(compute_message(line))
+            except Exception as error:
+                future.set_result(f'Ошибка: {error}')
+
+
+async def serve(host: str, port: int,
+                unix_path: Optional[str] = None) -> None:
+    """Обслуживать соединения до получения SIGINT или SIGTERM."""
+    training_server = TrainingServer()
+    if unix_path:
+        await training_server.start_unix(unix_path)
+    else:
+        await training_server.start_tcp(host, port)
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopped.set)
+    await stopped.wait()
+    await training_server.close(timeout=5)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Сервер расчёта тренировок.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.unix))
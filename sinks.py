@@ -0,0 +1,162 @@
+import csv
+import io
+import json
+import struct
+from array import array
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, TextIO, Union
+
+from homework import InfoMessage
+
+FIELDS: tuple[str, ...] = ('training_type', 'duration', 'distance', 'speed',
+                           'calories')
+CHUNK_SIZE: int = 4096
+BLOCK_MAGIC: bytes = b'INF1'
+BLOCK_HEADER = struct.Struct('<4sII')
+ALIGNMENT: int = 8
+
+
+class Sink:
+    """Буферизованный вывод результатов: одна запись на блок."""
+
+    def __init__(self, out: Union[TextIO, BinaryIO],
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        self.out = out
+        self.chunk_size: int = chunk_size
+        self.buffer: list[InfoMessage] = []
+        self.written: int = 0
+
+    def __enter__(self) -> 'Sink':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
+
+    def encode(self, infos: list[InfoMessage]):
+        """Преобразовать блок результатов в строку или байты."""
+        raise NotImplementedError
+
+    def write(self, info: InfoMessage) -> None:
+        """Добавить результат тренировки в буфер."""
+        self.buffer.append(info)
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def write_many(self, infos: Iterable[InfoMessage]) -> None:
+        """Добавить несколько результатов тренировок."""
+        for info in infos:
+            self.write(info)
+
+    def flush(self) -> None:
+        """Записать накопленный блок одним вызовом `write`."""
+        if self.buffer:
+            self.out.write(self.encode(self.buffer))
+            self.written += len(self.buffer)
+            self.buffer.clear()
+        self.out.flush()
+
+
+class TextSink(Sink):
+    """Читаемые сообщения `InfoMessage.MESSAGE`."""
+
+    def encode(self, infos: list[InfoMessage]) -> str:
+        return ''.join([info.get_message() + '\n' for info in infos])
+
+
+class JsonLinesSink(Sink):
+    """Поля результатов в формате JSON Lines."""
+
+    def encode(self, infos: list[InfoMessage]) -> str:
+        return ''.join([json.dumps({
+            'training_type': info.training_type,
+            'duration': info.duration,
+            'distance': info.distance,
+            'speed': info.speed,
+            'calories': info.calories,
+        }, ensure_ascii=False) + '\n' for info in infos])
+
+
+class CsvSink(Sink):
+    """Поля результатов в формате CSV с заголовком."""
+
+    def encode(self, infos: list[InfoMessage]) -> str:
+        text = io.StringIO()
+        writer = csv.writer(text, lineterminator='\n')
+        if not self.written:
+            writer.writerow(FIELDS)
+        writer.writerows([(info.training_type, info.duration, info.distance,
+                           info.speed, info.calories) for info in infos])
+        return text.getvalue()
+
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (-size % ALIGNMENT)
+
+
+class ColumnarSink(Sink):
+    """Колонки результатов в двоичных блоках, читаемых без копирования.
+
+    Блок: заголовок `<4sII` (метка, число записей, длина имён), имена
+    видов тренировок через `\\n`, коды видов по байту на запись и четыре
+    колонки float64; каждая часть выровнена на 8 байт.
+    """
+
+    def encode(self, infos: list[InfoMessage]) -> bytes:
+        names: dict[str, int] = {}
+        codes = array('B', [names.setdefault(info.training_type, len(names))
+                            for info in infos])
+        encoded_names = '\n'.join(names).encode('utf-8')
+        parts = [BLOCK_HEADER.pack(BLOCK_MAGIC, len(infos),
+                                   len(encoded_names)),
+                 encoded_names]
+        parts.append(_padding(BLOCK_HEADER.size + len(encoded_names)))
+        parts.extend((codes.tobytes(), _padding(len(codes))))
+        for field in FIELDS[1:]:
+            parts.append(array('d', [getattr(info, field)
+                                     for info in infos]).tobytes())
+        return b''.join(parts)
+
+
+class ColumnBlock(NamedTuple):
+    """Блок колонок поверх исходного буфера."""
+    names: list[str]
+    codes: memoryview
+    duration: memoryview
+    distance: memoryview
+    speed: memoryview
+    calories: memoryview
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def training_types(self) -> list[str]:
+        return [self.names[code] for code in self.codes]
+
+
+def read_columns(buffer) -> Iterator[ColumnBlock]:
+    """Читать блоки колонок из буфера без копирования данных."""
+    view = memoryview(buffer).cast('B')
+    offset = 0
+    while offset < len(view):
+        magic, count, names_size = BLOCK_HEADER.unpack_from(view, offset)
+        if magic != BLOCK_MAGIC:
+            raise ValueError('Неизвестный формат блока результатов')
+        offset += BLOCK_HEADER.size
+        names = bytes(view[offset:offset + names_size]).decode('utf-8')
+        offset += names_size
+        offset += -offset % ALIGNMENT
+        codes = view[offset:offset + count]
+        offset += count + -count % ALIGNMENT
+        columns = []
+        for _ in FIELDS[1:]:
+            columns.append(view[offset:offset + 8 * count].cast('d'))
+            offset += 8 * count
+        yield ColumnBlock(names.split('\n') if names else [], codes,
+                          *columns)
+
+
+SINKS: dict[str, type[Sink]] = {
+    'text': TextSink,
+    'json': JsonLinesSink,
+    'csv': CsvSink,
+    'columnar': ColumnarSink,
+}
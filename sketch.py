@@ -0,0 +1,203 @@
+import base64
+import math
+import random
+from hashlib import blake2b
+from typing import Hashable, Optional
+
+from homework import InfoMessage
+
+KLL_K: int = 200
+KLL_C: float = 2 / 3
+HLL_PRECISION: int = 14
+PERCENTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+class KLLSketch:
+    """Квантильный скетч KLL с ограниченной памятью.
+
+    Память — O(k) значений. Ошибка по рангу для k=200 не больше
+    около 1.7% с вероятностью 99% и убывает как 1/k.
+    """
+
+    def __init__(self, k: int = KLL_K, seed: Optional[int] = None) -> None:
+        self.k: int = k
+        self.count: int = 0
+        self.compactors: list[list[float]] = [[]]
+        self.random: random.Random = random.Random(seed)
+
+    def capacity(self, height: int) -> int:
+        """Вместимость уровня `height`."""
+        depth = len(self.compactors) - height - 1
+        return max(2, math.ceil(self.k * KLL_C ** depth))
+
+    @property
+    def size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def update(self, value: float) -> None:
+        """Учесть одно значение."""
+        self.compactors[0].append(value)
+        self.count += 1
+        if len(self.compactors[0]) >= self.capacity(0):
+            self.compress()
+
+    def compress(self) -> None:
+        """Сжать переполненные уровни, поднимая половину значений выше."""
+        height = 0
+        while height < len(self.compactors):
+            compactor = self.compactors[height]
+            if len(compactor) >= self.capacity(height):
+                if height + 1 == len(self.compactors):
+                    self.compactors.append([])
+                compactor.sort()
+                leftover = [compactor.pop()] if len(compactor) % 2 else []
+                offset = self.random.randint(0, 1)
+                self.compactors[height + 1].extend(compactor[offset::2])
+                self.compactors[height] = leftover
+            height += 1
+
+    def merge(self, other: 'KLLSketch') -> None:
+        """Добавить значения другого скетча."""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for height, compactor in enumerate(other.compactors):
+            self.compactors[height].extend(compactor)
+        self.count += other.count
+        self.compress()
+
+    def quantile(self, share: float) -> float:
+        """Вернуть приблизительный квантиль; `nan` для пустого скетча."""
+        weighted = sorted((value, 1 << height)
+                          for height, compactor in enumerate(self.compactors)
+                          for value in compactor)
+        if not weighted:
+            return math.nan
+        total = sum(weight for _, weight in weighted)
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= share * total:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> dict:
+        return {'k': self.k, 'count': self.count,
+                'compactors': self.compactors}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'KLLSketch':
+        sketch = cls(data['k'])
+        sketch.count = data['count']
+        sketch.compactors = [list(compactor)
+                             for compactor in data['compactors']]
+        return sketch
+
+
+class HyperLogLog:
+    """Оценка числа различных значений.
+
+    Память — `2 ** precision` байт (16 КиБ при precision=14),
+    стандартная ошибка 1.04 / sqrt(2 ** precision), то есть 0.81%.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        self.precision: int = precision
+        self.registers: bytearray = bytearray(1 << precision)
+
+    def add(self, value: Hashable) -> None:
+        """Учесть значение; значения различаются по `repr`."""
+        hashed = int.from_bytes(
+            blake2b(repr(value).encode('utf-8'), digest_size=8).digest(),
+            'big')
+        bits = 64 - self.precision
+        index = hashed >> bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Объединить с другим счётчиком той же точности."""
+        if other.precision != self.precision:
+            raise ValueError('Точность HyperLogLog должна совпадать')
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self) -> int:
+        """Оценить число различных значений."""
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(
+            2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+    def to_dict(self) -> dict:
+        return {'precision': self.precision,
+                'registers': base64.b64encode(self.registers).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'HyperLogLog':
+        sketch = cls(data['precision'])
+        sketch.registers = bytearray(base64.b64decode(data['registers']))
+        return sketch
+
+
+class WorkoutSketches:
+    """Перцентили калорий и скорости по видам и число спортсменов."""
+    METRICS: tuple[str, ...] = ('calories', 'speed')
+
+    def __init__(self, k: int = KLL_K,
+                 precision: int = HLL_PRECISION) -> None:
+        self.k: int = k
+        self.quantiles: dict[tuple[str, str], KLLSketch] = {}
+        self.athletes: HyperLogLog = HyperLogLog(precision)
+
+    def add(self, info: InfoMessage,
+            athlete: Optional[Hashable] = None) -> None:
+        """Учесть результат `Training.show_training_info`."""
+        for metric in self.METRICS:
+            key = (info.training_type, metric)
+            if key not in self.quantiles:
+                self.quantiles[key] = KLLSketch(self.k)
+            self.quantiles[key].update(getattr(info, metric))
+        if athlete is not None:
+            self.athletes.add(athlete)
+
+    def merge(self, other: 'WorkoutSketches') -> None:
+        """Объединить со скетчами другого шарда или процесса."""
+        for key, sketch in other.quantiles.items():
+            if key not in self.quantiles:
+                self.quantiles[key] = KLLSketch(self.k)
+            self.quantiles[key].merge(sketch)
+        self.athletes.merge(other.athletes)
+
+    def summary(self) -> dict:
+        """Вернуть перцентили по видам тренировок и число спортсменов."""
+        result: dict = {'athletes': self.athletes.count(), 'workouts': {}}
+        for (training_type, metric), sketch in sorted(
+                self.quantiles.items()):
+            workout = result['workouts'].setdefault(training_type, {})
+            workout['count'] = sketch.count
+            for share in PERCENTILES:
+                workout[f'{metric}_p{round(share * 100)}'] = sketch.quantile(
+                    share)
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            'k': self.k,
+            'quantiles': [[training_type, metric, sketch.to_dict()]
+                          for (training_type, metric), sketch
+                          in self.quantiles.items()],
+            'athletes': self.athletes.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WorkoutSketches':
+        sketches = cls(data['k'])
+        for training_type, metric, sketch in data['quantiles']:
+            sketches.quantiles[(training_type, metric)] = (
+                KLLSketch.from_dict(sketch))
+        sketches.athletes = HyperLogLog.from_dict(data['athletes'])
+        return sketches
@@ -0,0 +1,93 @@
+import sys
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, TextIO
+
+from homework import InfoMessage, format_many, read_package
+
+CHUNK_SIZE: int = 4096
+
+
+@dataclass
+class StreamStats:
+    """Статистика потоковой обработки пакетов."""
+    packets: int = 0
+    seconds: float = 0.0
+
+    @property
+    def packets_per_sec(self) -> float:
+        if not self.seconds:
+            return 0.0
+        return self.packets / self.seconds
+
+
+def parse_number(value: str) -> float:
+    """Преобразовать поле пакета в int или float."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def parse_packet(line: str) -> tuple[str, list]:
+    """Разобрать строку вида `SWM 720 1 80 25 40` в пакет."""
+    workout_type, *fields = line.replace(',', ' ').split()
+    return workout_type, [parse_number(field) for field in fields]
+
+
+def parse_athlete_packet(line: str) -> tuple[str, str, list]:
+    """Разобрать строку вида `anna RUN 15000 1 75` в пакет спортсмена."""
+    athlete, packet = line.split(maxsplit=1)
+    return (athlete, *parse_packet(packet))
+
+
+def iter_packets(lines: Iterable[str]) -> Iterator[tuple[str, list]]:
+    """Читать пакеты из источника строк, пропуская пустые и комментарии."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield parse_packet(line)
+
+
+def iter_infos(
+        packets: Iterable[tuple[str, list]]) -> Iterator[InfoMessage]:
+    """Рассчитать тренировки и вернуть их результаты по одному."""
+    for workout_type, data in packets:
+        yield read_package(workout_type, data).show_training_info()
+
+
+def iter_messages(packets: Iterable[tuple[str, list]]) -> Iterator[str]:
+    """Рассчитать тренировки и вернуть их сообщения по одному."""
+    for info in iter_infos(packets):
+        yield info.get_message()
+
+
+def run(source: Iterable[str],
+        out: TextIO,
+        chunk_size: int = CHUNK_SIZE) -> StreamStats:
+    """Обработать поток пакетов, записывая вывод крупными блоками."""
+    stats = StreamStats()
+    started = time.perf_counter()
+    chunk: list[InfoMessage] = []
+    for info in iter_infos(iter_packets(source)):
+        chunk.append(info)
+        if len(chunk) >= chunk_size:
+            stats.packets += len(chunk)
+            out.write(format_many(chunk) + '\n')
+            chunk.clear()
+    if chunk:
+        stats.packets += len(chunk)
+        out.write(format_many(chunk) + '\n')
+    out.flush()
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as source:
+            stats = run(source, sys.stdout)
+    else:
+        stats = run(sys.stdin, sys.stdout)
+    print(f'Обработано пакетов: {stats.packets}; '
+          f'{stats.packets_per_sec:.0f} пакетов/с.', file=sys.stderr)
@@ -0,0 +1,48 @@
+import pytest
+
+import aggregate
+import bench
+import homework
+
+
+def test_totals_per_athlete():
+    aggregator = aggregate.Aggregator(windows={})
+    aggregator.add('anna', 'RUN', [15000, 1, 75])
+    aggregator.add('anna', 'RUN', [9000, 1, 75])
+    aggregator.add('anna', 'SWM', [720, 1, 80, 25, 40])
+    aggregator.add('boris', 'WLK', [9000, 1, 75, 180])
+    snapshot = aggregator.snapshot('anna')
+    assert set(snapshot) == {'Running', 'Swimming'}
+    running = snapshot['Running']
+    assert running['count'] == 2
+    assert running['duration'] == 2
+    assert running['distance'] == pytest.approx(9.75 + 5.85)
+    assert running['calories'] == pytest.approx(699.75 + 383.85)
+    assert running['mean_speed'] == pytest.approx((9.75 + 5.85) / 2)
+    assert aggregator.snapshot('boris')['SportsWalking']['count'] == 1
+    assert aggregator.snapshot('nobody') == {}
+
+
+def test_sliding_window_expires():
+    aggregator = aggregate.Aggregator(windows={'hour': 3600}, buckets=60)
+    info = homework.read_package('RUN', [15000, 1, 75]).show_training_info()
+    aggregator.add_info('anna', info, timestamp=0)
+    aggregator.add_info('anna', info, timestamp=1800)
+    assert aggregator.snapshot('anna', 'hour', now=3000)['Running'][
+        'count'] == 2
+    window = aggregator.snapshot('anna', 'hour', now=3700)['Running']
+    assert window['count'] == 1, (
+        'Тренировки старше окна не должны учитываться.'
+    )
+    assert window['calories'] == pytest.approx(info.calories)
+    assert aggregator.snapshot('anna')['Running']['count'] == 2
+
+
+def test_fully_expired_window_is_zero():
+    aggregator = aggregate.Aggregator(windows={'hour': 3600}, buckets=60)
+    for minute, package in enumerate(bench.generate_packages(50, seed=5)):
+        aggregator.add('anna', *package, timestamp=minute * 60)
+    for totals in aggregator.snapshot('anna', 'hour', now=10 ** 6).values():
+        assert totals == aggregate.Totals().snapshot(), (
+            'После истечения окна суммы должны быть ровно нулевыми.'
+        )
@@ -0,0 +1,78 @@
+import pytest
+
+import batch
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+    ('RUN', [420, 4, 20]),
+    ('WLK', [420, 4, 20, 42]),
+    ('WLK', [1206, 12, 6, 12]),
+]
+
+
+def expected(packages):
+    return [homework.read_package(*package).show_training_info()
+            for package in packages]
+
+
+USE_NUMPY = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(
+        batch.np is None, reason='NumPy не установлен')),
+]
+
+
+def test_packages_to_columns():
+    assert batch.packages_to_columns(PACKAGES[:3]) == {
+        'workout_type': ['SWM', 'RUN', 'WLK'],
+        'action': [720, 15000, 9000],
+        'duration': [1, 1, 1],
+        'weight': [80, 75, 75],
+        'height': [0, 0, 180],
+        'length_pool': [25, 0, 0],
+        'count_pool': [40, 0, 0],
+    }
+
+
+@pytest.mark.parametrize('use_numpy', USE_NUMPY)
+def test_compute_batch_matches_classes(use_numpy):
+    result = batch.compute_batch(**batch.packages_to_columns(PACKAGES),
+                                 use_numpy=use_numpy)
+    for index, info in enumerate(expected(PACKAGES)):
+        assert result.distance[index] == info.distance
+        assert result.speed[index] == info.speed
+        assert result.calories[index] == info.calories, (
+            'Пакетный расчёт калорий должен совпадать с классами тренировок.'
+        )
+
+
+def test_to_messages_output():
+    data = batch.packages_to_columns(PACKAGES)
+    result = batch.compute_batch(**data, use_numpy=False)
+    messages = batch.to_messages(data['workout_type'], data['duration'],
+                                 result)
+    assert ([message.get_message() for message in messages]
+            == [info.get_message() for info in expected(PACKAGES)])
+
+
+@pytest.mark.parametrize('use_numpy', USE_NUMPY)
+@pytest.mark.parametrize('package', [
+    ('RUN', [1, 0, 1]),
+    ('SWM', [720, 0, 80, 25, 40]),
+    ('WLK', [9000, 1, 75, 0]),
+])
+def test_compute_batch_zero_division(use_numpy, package):
+    with pytest.raises(ZeroDivisionError):
+        homework.read_package(*package).show_training_info()
+    with pytest.raises(ZeroDivisionError):
+        batch.compute_batch(**batch.packages_to_columns(PACKAGES + [package]),
+                            use_numpy=use_numpy)
+
+
+def test_compute_batch_unknown_code():
+    with pytest.raises(ValueError):
+        batch.compute_batch(['BOX'], [1], [1], [1], use_numpy=False)
@@ -0,0 +1,32 @@
+import copy
+
+import bench
+import homework
+
+
+def test_generate_packages_are_valid():
+    packages = bench.generate_packages(300, seed=1)
+    assert packages == bench.generate_packages(300, seed=1)
+    assert {package[0] for package in packages} == set(bench.MIX)
+    for package in packages:
+        homework.read_package(*package).show_training_info()
+
+
+def test_run_and_compare():
+    current = bench.run(sizes=(50,))
+    assert set(current['results']) == {
+        'read_package', 'get_spent_calories[SWM]',
+        'get_spent_calories[RUN]', 'get_spent_calories[WLK]',
+        'show_training_info', 'get_message',
+    }
+    stats = current['results']['read_package']['50']
+    assert stats['p50_ns'] <= stats['p95_ns'] <= stats['p99_ns']
+    assert bench.compare(current, current) == []
+    baseline = copy.deepcopy(current)
+    baseline['results']['get_message']['50']['ops_per_sec'] *= 2
+    assert bench.compare(current, baseline) == ['get_message [50]: -50.0%']
+
+
+def test_thread_scaling_covers_every_count():
+    packages = bench.generate_packages(50, seed=2)
+    assert list(bench.thread_scaling(packages, 3)) == ['1', '2', '3']
@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+import batch
+import binary
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+]
+
+
+def dump(packages):
+    buffer = io.BytesIO()
+    binary.write_records(buffer, packages)
+    return buffer.getvalue()
+
+
+def messages(packages):
+    return [homework.read_package(*package).show_training_info().get_message()
+            for package in packages]
+
+
+def test_records_have_fixed_width():
+    data = dump(PACKAGES)
+    assert len(data) == len(binary.MAGIC) + binary.RECORD.size * len(PACKAGES)
+
+
+def test_iter_packages_round_trip():
+    assert messages(binary.iter_packages(dump(PACKAGES))) == messages(
+        PACKAGES
+    )
+
+
+def test_fractional_action_round_trip():
+    packages = [('RUN', [1206.5, 1, 75])]
+    assert list(binary.iter_packages(dump(packages))) == packages
+
+
+def test_record_file(tmp_path):
+    path = tmp_path / 'packets.bin'
+    with open(path, 'wb') as target:
+        assert binary.write_records(target, PACKAGES) == 4
+    with binary.RecordFile(str(path)) as records:
+        assert len(records) == 4
+        assert messages(records) == messages(PACKAGES)
+        assert (records[-1].show_training_info().get_message()
+                == messages(PACKAGES)[-1])
+        with pytest.raises(IndexError):
+            records[4]
+
+
+def test_columns_feed_batch():
+    result = batch.compute_batch(**binary.columns(dump(PACKAGES)))
+    expected = [homework.read_package(*package).show_training_info()
+                for package in PACKAGES]
+    assert list(result.calories) == [info.calories for info in expected]
+
+
+def test_bad_header():
+    with pytest.raises(ValueError):
+        list(binary.iter_packages(b'XXXX'))
+    with pytest.raises(ValueError):
+        binary.pack_record('BOX', [1, 1, 1])
+
+
+@pytest.mark.parametrize('package', [
+    ('WLK', [9000, 1, 75]),
+    ('RUN', [1, 1, 1, 99]),
+    ('SWM', [720, 1, 80, 25]),
+])
+def test_pack_record_checks_arity(package):
+    with pytest.raises(ValueError):
+        binary.pack_record(*package)
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import BASE_DIR
+
+CLI = str(BASE_DIR / 'cli.py')
+PACKETS = 'SWM 720 1 80 25 40\nRUN 15000 1 75\nWLK 9000 1 75 180\n'
+EXPECTED = [
+    'Тип тренировки: Swimming; Длительность: 1.000 ч.; '
+    'Дистанция: 0.994 км; Ср. скорость: 1.000 км/ч; '
+    'Потрачено ккал: 336.000.',
+    'Тип тренировки: Running; Длительность: 1.000 ч.; '
+    'Дистанция: 9.750 км; Ср. скорость: 9.750 км/ч; '
+    'Потрачено ккал: 699.750.',
+    'Тип тренировки: SportsWalking; Длительность: 1.000 ч.; '
+    'Дистанция: 5.850 км; Ср. скорость: 5.850 км/ч; '
+    'Потрачено ккал: 157.500.',
+]
+HEAVY_MODULES = ('homework', 'dataclasses', 'asyncio', 'numpy')
+STARTUP_IMPORT_TARGET_US = 100_000
+
+
+def run_cli(*args, stdin=PACKETS):
+    return subprocess.run(
+        [sys.executable, *args], input=stdin, capture_output=True,
+        text=True, check=True, cwd=BASE_DIR,
+    )
+
+
+def import_times(stderr):
+    modules = {}
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and 'self [us]' not in line:
+            self_time, _, name = line[len('import time:'):].split('|')
+            modules[name.strip()] = int(self_time)
+    return modules
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    path = str(tmp_path / 'homework.sock')
+    process = subprocess.Popen([sys.executable, CLI, '--serve', path],
+                               cwd=BASE_DIR)
+    deadline = time.monotonic() + 10
+    while not os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    yield path
+    process.terminate()
+    process.wait(timeout=10)
+
+
+def test_cli_text_output():
+    assert run_cli(CLI).stdout.splitlines() == EXPECTED
+
+
+def test_cli_skips_bad_lines():
+    result = run_cli(CLI, stdin='RUN 1 0 1\nRUN x 1 1\n' + PACKETS)
+    assert result.stdout.splitlines() == EXPECTED
+    assert result.stderr.splitlines() == [
+        'Ошибка: OUT_OF_RANGE',
+        "Ошибка: could not convert string to float: 'x'",
+    ]
+
+
+def test_cli_json_output(tmp_path):
+    path = tmp_path / 'packets.txt'
+    path.write_text(PACKETS, encoding='utf-8')
+    lines = run_cli(CLI, '--format', 'json', str(path)).stdout.splitlines()
+    assert lines[1] == (
+        '{"training_type": "Running", "duration": 1, "distance": 9.75, '
+        '"speed": 9.75, "calories": 699.75}'
+    )
+
+
+def test_cli_import_is_light():
+    result = run_cli('-c', 'import sys, cli; print(*sorted(sys.modules))')
+    loaded = set(result.stdout.split())
+    assert not loaded & set(HEAVY_MODULES), (
+        'Импорт cli не должен загружать расчётные модули.'
+    )
+
+
+def test_thin_client_startup(daemon):
+    result = run_cli('-X', 'importtime', CLI, '--connect', daemon,
+                     stdin='# header\n\n' + PACKETS)
+    assert result.stdout.splitlines() == EXPECTED
+    modules = import_times(result.stderr)
+    assert not modules.keys() & set(HEAVY_MODULES)
+    assert sum(modules.values()) < STARTUP_IMPORT_TARGET_US, (
+        'Тонкий клиент должен запускаться быстрее цели по времени импорта.'
+    )
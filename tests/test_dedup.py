@@ -0,0 +1,84 @@
+import pytest
+
+import bench
+import dedup
+import homework
+from conftest import Capturing
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_fingerprint_is_canonical():
+    assert dedup.fingerprint('RUN', [15000, 1, 75]) == dedup.fingerprint(
+        'RUN', (15000.0, 1.0, 75.0))
+    assert dedup.fingerprint('RUN', [15000, 1, 75]) != dedup.fingerprint(
+        'WLK', [15000, 1, 75])
+
+
+def test_read_package_skips_repeats():
+    deduplicator = dedup.Deduplicator(capacity=1000)
+    first = deduplicator.read_package('RUN', [15000, 1, 75])
+    assert isinstance(first, homework.Running)
+    repeat = deduplicator.read_package('RUN', [15000, 1, 75])
+    assert isinstance(repeat, dedup.Repeat)
+    assert (deduplicator.packets, deduplicator.duplicates) == (2, 1)
+    assert repeat.show_training_info() == homework.InfoMessage(
+        'Running', 0.0, 0.0, 0.0, 0.0), (
+        'Повтор не должен удваивать калории.'
+    )
+    with Capturing() as output:
+        for package in [('SWM', [720, 1, 80, 25, 40])] * 3:
+            training = deduplicator.read_package(*package)
+            if not isinstance(training, dedup.Repeat):
+                homework.main(training)
+    assert len(output) == 1
+
+
+def test_read_package_is_drop_in():
+    deduplicator = dedup.Deduplicator(capacity=1000)
+    calories = sum(
+        deduplicator.read_package(*package).show_training_info().calories
+        for package in [('RUN', [15000, 1, 75])] * 3
+    )
+    assert calories == homework.read_package(
+        'RUN', [15000, 1, 75]).get_spent_calories()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            deduplicator.read_package('BOX', [1, 1, 1])
+        with pytest.raises(TypeError):
+            deduplicator.read_package('RUN', [1, 1])
+    assert deduplicator.packets == 3
+
+
+def test_fingerprint_huge_numbers():
+    assert dedup.fingerprint('RUN', [10**400, 1, 1]) != dedup.fingerprint(
+        'RUN', [10**400 + 1, 1, 1])
+    deduplicator = dedup.Deduplicator(capacity=100)
+    assert not deduplicator.is_duplicate('RUN', [10**400, 1, 1])
+    assert deduplicator.is_duplicate('RUN', [10**400, 1, 1])
+
+
+def test_filter_without_false_negatives():
+    packages = bench.generate_packages(2000, seed=11)
+    deduplicator = dedup.Deduplicator(capacity=5000)
+    unique = list(deduplicator.filter(packages + packages[:500]))
+    assert deduplicator.duplicates >= 500
+    assert len(unique) >= 2000 - 10
+
+
+def test_window_rotation_forgets_old_packets():
+    clock = FakeClock()
+    deduplicator = dedup.Deduplicator(window=10, capacity=100, clock=clock)
+    assert not deduplicator.is_duplicate('RUN', [15000, 1, 75])
+    clock.now = 15
+    assert deduplicator.is_duplicate('RUN', [15000, 1, 75]), (
+        'Пакет помнится не меньше одного окна.'
+    )
+    clock.now = 35
+    assert not deduplicator.is_duplicate('RUN', [15000, 1, 75])
@@ -0,0 +1,86 @@
+import math
+
+import difftest
+import homework
+
+
+def test_registered_candidates_match_reference():
+    assert next(iter(difftest.CANDIDATES)) == 'closed_form'
+    for row in difftest.run(size=3000, seed=7):
+        assert row['mismatches'] == [], row['candidate']
+        assert row['speedup'] > 0
+
+
+def walking_quotients(packages):
+    for workout_type, data in packages:
+        if workout_type == 'WLK':
+            speed = homework.read_package(workout_type, data).get_mean_speed()
+            yield speed**2, data[3]
+
+
+def test_edge_packages_reach_floor_boundary():
+    packages = difftest.generate_packages(2000, seed=3)
+    near = [(square, height) for square, height in walking_quotients(packages)
+            if abs(square / height - round(square / height)) < 1e-9]
+    assert any(square // height == round(square / height) - 1
+               for square, height in near), (
+        'Нужны пакеты чуть ниже целого `speed ** 2 / height`.'
+    )
+    assert any(square // height == round(square / height)
+               for square, height in near)
+
+
+def fudged_floor(packages):
+    result = difftest.closed_form(packages)
+    for index, (workout_type, data) in enumerate(packages):
+        if workout_type == 'WLK':
+            distance, speed, _ = result[index]
+            action, duration, weight, height = data
+            calories = ((0.035 * weight
+                        + math.floor(speed**2 / height + 1e-9)
+                        * 0.029 * weight)
+                        * (duration * 60))
+            result[index] = (distance, speed, calories)
+    return result
+
+
+def test_edge_packages_catch_fudged_floor():
+    packages = difftest.generate_packages(2000, seed=3)
+    expected = difftest.reference(packages)
+    assert difftest.mismatches(expected, fudged_floor(packages), packages)
+    realistic = difftest.generate_packages(2000, seed=3, edge_share=0)
+    assert not difftest.mismatches(difftest.reference(realistic),
+                                   fudged_floor(realistic), realistic), (
+        'Ошибку у границы ловят только пограничные пакеты.'
+    )
+
+
+def test_edge_packages_catch_true_division_in_walking():
+    def true_division(packages):
+        result = difftest.closed_form(packages)
+        for index, (workout_type, data) in enumerate(packages):
+            if workout_type == 'WLK':
+                distance, speed, _ = result[index]
+                action, duration, weight, height = data
+                calories = ((0.035 * weight
+                            + (speed**2 / height) * 0.029 * weight)
+                            * (duration * 60))
+                result[index] = (distance, speed, calories)
+        return result
+
+    report = difftest.run(size=500, candidates={'bad': true_division})
+    assert report[0]['mismatches']
+
+
+def test_edge_packages_catch_missing_swimming_speed_override():
+    def distance_speed(packages):
+        result = difftest.closed_form(packages)
+        for index, (workout_type, data) in enumerate(packages):
+            if workout_type == 'SWM':
+                distance, _, _ = result[index]
+                speed = distance / data[1]
+                result[index] = (distance, speed, (speed + 1.1) * 2 * data[2])
+        return result
+
+    report = difftest.run(size=500, candidates={'bad': distance_speed})
+    assert report[0]['mismatches']
@@ -0,0 +1,45 @@
+import pytest
+
+import aggregate
+import bench
+import extsort
+
+PACKAGES = bench.generate_packages(500, seed=7)
+LINES = [
+    f'athlete-{index % 37} {workout_type} {" ".join(map(str, data))}'
+    for index, (workout_type, data) in enumerate(PACKAGES)
+]
+
+
+def in_memory(key):
+    aggregator = aggregate.Aggregator(windows={})
+    for index, (workout_type, data) in enumerate(PACKAGES):
+        aggregator.add(f'athlete-{index % 37}', workout_type, data)
+    result = {}
+    for athlete, totals in aggregator.totals.items():
+        for training_type, total in totals.items():
+            group = extsort.KEYS[key](athlete, training_type)
+            result.setdefault(group, aggregate.Totals()).merge(total)
+    return {group: totals.snapshot() for group, totals in result.items()}
+
+
+@pytest.mark.parametrize('key', list(extsort.KEYS))
+def test_group_by_spills_and_merges(key, tmp_path):
+    states = []
+    groups = list(extsort.group_by(
+        LINES, key, memory_limit=extsort.ENTRY_BYTES * 10,
+        directory=str(tmp_path), progress=states.append, progress_every=100,
+    ))
+    assert [group for group, _ in groups] == sorted(in_memory(key))
+    expected = in_memory(key)
+    for group, totals in groups:
+        assert totals['count'] == expected[group]['count']
+        assert totals['calories'] == pytest.approx(
+            expected[group]['calories'])
+    assert states[-1]['packets'] == 500
+    assert states[-1]['groups'] == len(groups)
+    if len(groups) > 10:
+        assert states[-1]['runs'] > 1, (
+            'При нехватке памяти группы должны сбрасываться на диск.'
+        )
+    assert not list(tmp_path.iterdir())
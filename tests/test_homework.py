@@ -363,3 +363,95 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def test_format_many():
+    messages = [
+        homework.read_package(*package).show_training_info()
+        for package in [('SWM', [720, 1, 80, 25, 40]),
+                        ('RUN', [15000, 1, 75])]
+    ]
+    assert homework.format_many(messages) == '\n'.join(
+        message.get_message() for message in messages
+    )
+    assert homework.format_many([]) == ''
+
+
+def test_get_cached_message():
+    info_message = homework.InfoMessage('Swimming', 1, 75, 1, 80)
+    expected = info_message.get_message()
+    assert homework.get_cached_message(info_message) == expected
+    assert homework.get_cached_message(
+        homework.InfoMessage('Swimming', 1, 75, 1, 80)
+    ) is homework.get_cached_message(info_message), (
+        'Повторяющиеся сообщения должны браться из кэша.'
+    )
+
+
+def test_metrics_follow_changed_data():
+    running = homework.Running(9000, 1, 75)
+    assert running.get_spent_calories() == 383.85
+    running.weight_in_kg = 20
+    assert running.get_spent_calories() == 102.36, (
+        'После изменения данных тренировки показатели '
+        'нужно пересчитать.'
+    )
+
+
+def test_read_training_info_cache():
+    homework.clear_training_info_cache()
+    first = homework.read_training_info('RUN', [15000, 1, 75])
+    second = homework.read_training_info('RUN', [15000, 1, 75])
+    assert first is second
+    assert first == homework.read_package(
+        'RUN', [15000, 1, 75]
+    ).show_training_info()
+    cache_info = homework.training_info_cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+    assert cache_info.maxsize == homework.INFO_CACHE_SIZE
+
+
+def test_workout_registry_schema():
+    schema = homework.WORKOUT_TYPES['WLK']
+    assert schema.training is homework.SportsWalking
+    assert schema.fields == ('action', 'duration', 'weight', 'height')
+    assert schema.arity == 4
+    assert schema.accepts([9000, 1, 75, 180])
+    assert not schema.accepts([9000, 1, 75])
+
+
+def test_register_new_workout(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+    monkeypatch.setattr(homework, '_CONSTRUCTORS',
+                        dict(homework._CONSTRUCTORS))
+
+    @homework.register('CYC')
+    class Cycling(homework.Training):
+        LEN_STEP: float = 5.5
+
+        def __init__(self, action, duration, weight, cadence):
+            super().__init__(action, duration, weight)
+            self.cadence = cadence
+
+    training = homework.read_package('CYC', [1000, 1, 75, 90])
+    assert isinstance(training, Cycling)
+    assert training.get_distance() == 5.5
+    assert homework.WORKOUT_TYPES['CYC'].fields[-1] == 'cadence'
+    with pytest.raises(ValueError):
+        homework.register('RUN')(Cycling)
+
+
+def test_register_rejects_variadic_constructor(monkeypatch):
+    monkeypatch.setattr(homework, 'WORKOUT_TYPES',
+                        dict(homework.WORKOUT_TYPES))
+    monkeypatch.setattr(homework, '_CONSTRUCTORS',
+                        dict(homework._CONSTRUCTORS))
+
+    class Rowing(homework.Training):
+        def __init__(self, *data):
+            super().__init__(*data)
+
+    with pytest.raises(ValueError):
+        homework.register('ROW')(Rowing)
+    assert 'ROW' not in homework.WORKOUT_TYPES
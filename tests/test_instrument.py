@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+import homework
+import instrument
+import stream
+from conftest import Capturing
+
+
+@pytest.fixture
+def instrumentation():
+    instrumentation = instrument.Instrumentation()
+    yield instrumentation
+    instrumentation.disable()
+
+
+@pytest.mark.parametrize('value', [0, 1, 31, 32, 33, 1000, 123456789])
+def test_histogram_bucket_bounds(value):
+    histogram = instrument.LatencyHistogram
+    upper = histogram.upper_bound(histogram.index(value))
+    assert value <= upper <= value * 1.0625 + 1
+
+
+def test_histogram_percentiles():
+    histogram = instrument.LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value)
+    assert histogram.count == 1000
+    assert 500 <= histogram.percentile(0.5) <= 532
+    assert 990 <= histogram.percentile(0.99) <= 1055
+
+
+def test_enable_and_disable_restore_originals(instrumentation):
+    constructors = dict(homework._CONSTRUCTORS)
+    get_message = homework.InfoMessage.get_message
+    instrumentation.enable()
+    assert homework._CONSTRUCTORS['RUN'] is not homework.Running
+    instrumentation.disable()
+    assert homework._CONSTRUCTORS == constructors
+    assert homework.InfoMessage.get_message is get_message
+
+
+def test_stage_statistics(instrumentation):
+    instrumentation.enable()
+    with Capturing():
+        homework.main(homework.read_package('RUN', [15000, 1, 75]))
+        homework.main(homework.read_package('SWM', [720, 1, 80, 25, 40]))
+    with pytest.raises(TypeError):
+        homework.read_package('RUN', [1, 1])
+    stats = {(row['stage'], row['workout']): row['count']
+             for row in json.loads(instrumentation.export_json())}
+    assert stats[('read_package', 'Running')] == 1
+    assert stats[('read_package', instrument.ERROR)] == 1
+    assert stats[('get_spent_calories', 'Swimming')] == 1
+    assert stats[('show_training_info', 'Running')] == 1
+    assert stats[('get_message', 'Swimming')] == 1
+    assert stats[('main', 'Swimming')] == 1
+    text = instrumentation.export_prometheus()
+    assert ('homework_stage_latency_seconds_count'
+            '{stage="main",workout="Running"} 1') in text
+
+
+def test_profile_packets(instrumentation):
+    with instrument.PacketProfile(instrumentation, packets=2) as profile:
+        for _ in range(5):
+            homework.read_package('WLK', [9000, 1, 75, 180])
+        assert profile.remaining == 0
+        assert instrumentation.profile is None
+    assert not instrumentation.enabled
+    assert profile.stats().total_calls > 0
+
+
+def test_direct_imports_are_instrumented(instrumentation):
+    with instrument.PacketProfile(instrumentation, packets=1) as profile:
+        stream.run(['RUN 15000 1 75'] * 5, io.StringIO())
+        assert profile.remaining == 0
+        assert instrumentation.profile is None
+    stats = {(row['stage'], row['workout']): row['count']
+             for row in instrumentation.snapshot()}
+    assert stats[('read_package', 'Running')] == 5
@@ -0,0 +1,25 @@
+from io import StringIO
+
+import parallel
+import stream
+
+LINES = ['SWM 720 1 80 25 40', 'RUN 15000 1 75', 'WLK 9000 1 75 180',
+         'RUN 1206 12 6', '', 'WLK 420 4 20 42'] * 5
+
+
+def test_iter_chunks():
+    chunks = list(parallel.iter_chunks(range(7), 3))
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_run_keeps_input_order(tmp_path):
+    expected = StringIO()
+    stream.run(LINES, expected)
+    path = tmp_path / 'packets.txt'
+    path.write_text('\n'.join(LINES), encoding='utf-8')
+    out = StringIO()
+    stats = parallel.process_file(str(path), out, workers=2, chunk_size=4)
+    assert out.getvalue() == expected.getvalue(), (
+        'Параллельная обработка должна сохранять порядок пакетов.'
+    )
+    assert stats.packets == 25
@@ -0,0 +1,75 @@
+import inspect
+
+import pytest
+
+import homework
+import records
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+@pytest.mark.parametrize('name', [
+    'Training', 'Running', 'SportsWalking', 'Swimming', 'InfoMessage',
+])
+def test_slotted_signatures(name):
+    slotted = getattr(records, name)
+    assert (inspect.signature(slotted).parameters.keys()
+            == inspect.signature(getattr(homework, name)).parameters.keys())
+
+
+@pytest.mark.parametrize('workout_type, data', PACKAGES)
+def test_slotted_training_matches_homework(workout_type, data):
+    training = records.read_package(workout_type, data)
+    assert not hasattr(training, '__dict__'), (
+        'Компактные тренировки не должны хранить `__dict__`.'
+    )
+    info = training.show_training_info()
+    assert not hasattr(info, '__dict__')
+    expected = homework.read_package(workout_type, data).show_training_info()
+    assert info.get_message() == expected.get_message()
+
+
+def test_training_batch_views():
+    trainings = records.TrainingBatch()
+    trainings.extend(PACKAGES)
+    assert len(trainings) == len(PACKAGES)
+    for training, (workout_type, data) in zip(trainings, PACKAGES):
+        expected = homework.read_package(workout_type, data)
+        assert type(training).__name__ == type(expected).__name__
+        assert (training.show_training_info().get_message()
+                == expected.show_training_info().get_message())
+
+
+def test_training_batch_unknown_code():
+    with pytest.raises(ValueError):
+        records.TrainingBatch().append('BOX', [1, 1, 1])
+
+
+def test_training_batch_fractional_action():
+    trainings = records.TrainingBatch()
+    trainings.append('RUN', [1206.5, 1, 75])
+    expected = homework.read_package('RUN', [1206.5, 1, 75])
+    assert (trainings[0].show_training_info().get_message()
+            == expected.show_training_info().get_message())
+
+
+@pytest.mark.parametrize('package, error', [
+    (('RUN', ['x', 1, 75]), TypeError),
+    (('RUN', [1, 1, 1, 5]), ValueError),
+    (('WLK', [9000, 1, 75]), ValueError),
+])
+def test_training_batch_rejects_whole_packet(package, error):
+    trainings = records.TrainingBatch()
+    trainings.append(*PACKAGES[0])
+    with pytest.raises(error):
+        trainings.append(*package)
+    trainings.append(*PACKAGES[2])
+    assert len(trainings) == len(trainings.action) == len(
+        trainings.count_pool) == 2
+    assert [type(training).__name__ for training in trainings] == [
+        'Swimming', 'SportsWalking'
+    ]
@@ -0,0 +1,45 @@
+import bench
+import homework
+import result_cache
+
+PACKAGES = bench.generate_packages(300, seed=13)
+
+
+def expected(packages):
+    return [homework.read_package(*package).show_training_info()
+            for package in packages]
+
+
+def test_cache_persists_between_runs(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    with result_cache.ResultCache(path) as cache:
+        assert cache.get_many(PACKAGES) == expected(PACKAGES)
+        assert cache.misses == 300
+    with result_cache.ResultCache(path) as cache:
+        infos = cache.get_many(PACKAGES + PACKAGES[:10])
+        assert (cache.hits, cache.misses) == (310, 0)
+    assert [info.get_message() for info in infos] == [
+        info.get_message() for info in expected(PACKAGES + PACKAGES[:10])
+    ]
+
+
+def test_coefficient_change_invalidates_only_that_sport(monkeypatch):
+    before = {code: result_cache.packet_key(code, data)
+              for code, data in [('RUN', [15000, 1, 75]),
+                                 ('WLK', [9000, 1, 75, 180])]}
+    monkeypatch.setattr(homework.Running, 'CORRECTION_COEFFICIENT_1', 19)
+    result_cache.class_signature.cache_clear()
+    try:
+        assert result_cache.packet_key('RUN', [15000, 1, 75]) != before[
+            'RUN']
+        assert result_cache.packet_key('WLK', [9000, 1, 75, 180]) == before[
+            'WLK']
+    finally:
+        monkeypatch.undo()
+        result_cache.class_signature.cache_clear()
+
+
+def test_packet_key_is_canonical():
+    assert result_cache.packet_key('RUN', [15000, 1, 75]) == (
+        result_cache.packet_key('RUN', (15000.0, 1.0, 75.0))
+    )
@@ -0,0 +1,108 @@
+import asyncio
+import socket
+import struct
+
+import homework
+import server
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+LINES = ['SWM 720 1 80 25 40', 'RUN 15000 1 75', 'WLK 9000 1 75 180']
+
+
+async def send(port, lines):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(''.join(line + '\n' for line in lines).encode('utf-8'))
+    await writer.drain()
+    writer.write_eof()
+    responses = [line.decode('utf-8').rstrip('\n') async for line in reader]
+    writer.close()
+    return responses
+
+
+async def run_clients(clients):
+    training_server = server.TrainingServer(batch_delay=0.01)
+    tcp_server = await training_server.start_tcp()
+    port = tcp_server.sockets[0].getsockname()[1]
+    results = await asyncio.gather(
+        *(send(port, LINES) for _ in range(clients))
+    )
+    await training_server.close(timeout=1)
+    return training_server, results
+
+
+def test_server_responses():
+    training_server, results = asyncio.run(run_clients(clients=10))
+    expected = [
+        homework.read_package(*package).show_training_info().get_message()
+        for package in PACKAGES
+    ]
+    assert results == [expected] * 10, (
+        'Сервер должен отвечать сообщениями в порядке пакетов.'
+    )
+    assert training_server.packets == 30
+    assert training_server.batches < training_server.packets, (
+        'Пакеты одновременных соединений нужно обрабатывать вместе.'
+    )
+
+
+def test_compute_message_error():
+    assert server.compute_message('BOX 1 1 1') == 'Ошибка: UNKNOWN_CODE'
+    assert server.compute_message('RUN 1 0 1') == 'Ошибка: OUT_OF_RANGE'
+
+
+def test_server_survives_failing_packet(monkeypatch):
+    compute_message = server.compute_message
+
+    def failing(line):
+        if line == 'RUN 1 1 1':
+            raise OverflowError('boom')
+        return compute_message(line)
+
+    monkeypatch.setattr(server, 'compute_message', failing)
+
+    async def scenario():
+        training_server = server.TrainingServer()
+        tcp_server = await training_server.start_tcp()
+        port = tcp_server.sockets[0].getsockname()[1]
+        first = await asyncio.wait_for(
+            send(port, ['RUN 1 1 1', 'RUN ' + '9' * 400 + ' 1 1']), timeout=5)
+        second = await asyncio.wait_for(send(port, [LINES[1]]), timeout=5)
+        await training_server.close(timeout=1)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == ['Ошибка: boom', 'Ошибка: OUT_OF_RANGE']
+    assert second == [
+        homework.read_package(*PACKAGES[1]).show_training_info().get_message()
+    ], 'Ошибка в одном пакете не должна останавливать сервер.'
+
+
+def test_server_survives_connection_reset():
+    async def scenario():
+        training_server = server.TrainingServer()
+        tcp_server = await training_server.start_tcp()
+        port = tcp_server.sockets[0].getsockname()[1]
+        loop = asyncio.get_running_loop()
+        client = socket.create_connection(('127.0.0.1', port))
+        client.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER,
+                          struct.pack('ii', 1, 0))
+        client.setblocking(False)
+        data = ''.join(line + '\n' for line in LINES * 20000).encode('utf-8')
+        try:
+            await asyncio.wait_for(loop.sock_sendall(client, data), timeout=1)
+        except asyncio.TimeoutError:
+            pass
+        client.close()
+        second = await asyncio.wait_for(send(port, [LINES[1]]), timeout=5)
+        await asyncio.wait_for(training_server.close(), timeout=5)
+        return training_server, second
+
+    training_server, second = asyncio.run(scenario())
+    assert len(second) == 1
+    assert not training_server.connections, (
+        'Сброшенное соединение должно закрываться.'
+    )
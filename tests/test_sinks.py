@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+
+import pytest
+
+import homework
+import sinks
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+    ('SWM', [1206, 12, 6, 12, 6]),
+]
+INFOS = [homework.read_package(*package).show_training_info()
+         for package in PACKAGES]
+
+
+class CountingWriter:
+    def __init__(self, out):
+        self.out = out
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return self.out.write(data)
+
+    def flush(self):
+        pass
+
+
+def test_sinks_write_once_per_chunk():
+    out = CountingWriter(io.StringIO())
+    with sinks.JsonLinesSink(out, chunk_size=2) as sink:
+        sink.write_many(INFOS)
+    assert out.writes == 3, 'Один вызов write на блок результатов.'
+    assert sink.written == 5
+
+
+def test_json_lines_sink():
+    out = io.StringIO()
+    with sinks.JsonLinesSink(out) as sink:
+        sink.write_many(INFOS)
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [homework.InfoMessage(**row) for row in rows] == INFOS
+
+
+def test_csv_sink_header_once():
+    out = io.StringIO()
+    with sinks.CsvSink(out, chunk_size=2) as sink:
+        sink.write_many(INFOS)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == list(sinks.FIELDS)
+    assert len(rows) == len(INFOS) + 1
+    assert float(rows[1][-1]) == INFOS[0].calories
+
+
+def test_text_sink_matches_messages():
+    out = io.StringIO()
+    with sinks.TextSink(out) as sink:
+        sink.write_many(INFOS)
+    assert out.getvalue() == homework.format_many(INFOS) + '\n'
+
+
+def test_columnar_round_trip():
+    out = io.BytesIO()
+    with sinks.ColumnarSink(out, chunk_size=3) as sink:
+        sink.write_many(INFOS)
+    data = out.getvalue()
+    blocks = list(sinks.read_columns(data))
+    assert [len(block) for block in blocks] == [3, 2]
+    restored = [
+        homework.InfoMessage(training_type, *values)
+        for block in blocks
+        for training_type, *values in zip(
+            block.training_types(), block.duration, block.distance,
+            block.speed, block.calories)
+    ]
+    assert restored == INFOS
+    assert blocks[0].calories.obj is data, (
+        'Колонки должны читаться без копирования.'
+    )
+
+
+def test_columnar_bad_block():
+    with pytest.raises(ValueError):
+        list(sinks.read_columns(b'XXXX' + bytes(8)))
@@ -0,0 +1,69 @@
+import json
+import math
+import random
+
+import pytest
+
+import bench
+import homework
+import sketch
+
+
+def test_kll_quantiles_within_error():
+    values = list(range(100000))
+    random.Random(1).shuffle(values)
+    kll = sketch.KLLSketch(seed=1)
+    for value in values:
+        kll.update(value)
+    assert kll.count == 100000
+    assert kll.size < 1000, 'Память скетча должна быть ограничена.'
+    for share in (0.5, 0.95, 0.99):
+        assert kll.quantile(share) == pytest.approx(share * 100000,
+                                                    abs=2000)
+
+
+def test_kll_merge_and_serialization():
+    left, right = sketch.KLLSketch(seed=1), sketch.KLLSketch(seed=2)
+    for value in range(50000):
+        left.update(value)
+        right.update(value + 50000)
+    left.merge(right)
+    restored = sketch.KLLSketch.from_dict(json.loads(json.dumps(
+        left.to_dict())))
+    assert restored.count == 100000
+    assert restored.quantile(0.5) == pytest.approx(50000, abs=2000)
+    assert math.isnan(sketch.KLLSketch().quantile(0.5))
+
+
+def test_hyperloglog_distinct_count():
+    left, right = sketch.HyperLogLog(), sketch.HyperLogLog()
+    for athlete in range(30000):
+        left.add(f'athlete-{athlete}')
+        right.add(f'athlete-{athlete + 20000}')
+    assert left.count() == pytest.approx(30000, rel=0.03)
+    left.merge(right)
+    assert left.count() == pytest.approx(50000, rel=0.03)
+    restored = sketch.HyperLogLog.from_dict(left.to_dict())
+    assert restored.count() == left.count()
+    with pytest.raises(ValueError):
+        left.merge(sketch.HyperLogLog(precision=10))
+
+
+def test_workout_sketches_summary():
+    shards = [sketch.WorkoutSketches(), sketch.WorkoutSketches()]
+    packages = bench.generate_packages(3000, seed=5)
+    for index, package in enumerate(packages):
+        info = homework.read_package(*package).show_training_info()
+        shards[index % 2].add(info, athlete=index % 700)
+    merged = sketch.WorkoutSketches.from_dict(
+        json.loads(json.dumps(shards[0].to_dict())))
+    merged.merge(shards[1])
+    summary = merged.summary()
+    assert summary['athletes'] == pytest.approx(700, rel=0.03)
+    assert set(summary['workouts']) == {'Running', 'SportsWalking',
+                                        'Swimming'}
+    running = summary['workouts']['Running']
+    assert sum(workout['count'] for workout
+               in summary['workouts'].values()) == 3000
+    assert (running['calories_p50'] <= running['calories_p95']
+            <= running['calories_p99'])
@@ -0,0 +1,36 @@
+from io import StringIO
+
+import homework
+import stream
+
+
+def test_parse_packet():
+    assert stream.parse_packet('SWM 720 1 80 25 40') == (
+        'SWM', [720, 1, 80, 25, 40]
+    )
+    assert stream.parse_packet('RUN,1206, 12.5,6') == ('RUN', [1206, 12.5, 6])
+
+
+def test_iter_packets_is_lazy():
+    def source():
+        yield 'RUN 15000 1 75'
+        raise AssertionError('Источник должен читаться лениво.')
+
+    packets = stream.iter_packets(source())
+    assert next(packets) == ('RUN', [15000, 1, 75])
+
+
+def test_run_output_matches_main():
+    lines = ['# daily dump', 'SWM 720 1 80 25 40', '',
+             'RUN 15000 1 75', 'WLK 9000 1 75 180']
+    out = StringIO()
+    stats = stream.run(lines, out, chunk_size=2)
+    expected = [
+        homework.read_package(*package).show_training_info().get_message()
+        for package in [('SWM', [720, 1, 80, 25, 40]),
+                        ('RUN', [15000, 1, 75]),
+                        ('WLK', [9000, 1, 75, 180])]
+    ]
+    assert out.getvalue().splitlines() == expected
+    assert stats.packets == 3
+    assert stats.packets_per_sec > 0
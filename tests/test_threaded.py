@@ -0,0 +1,46 @@
+import pytest
+
+import bench
+import homework
+import threaded
+
+PACKAGES = bench.generate_packages(200, seed=3)
+
+
+@pytest.mark.parametrize('workers, shard_size', [
+    (1, None), (4, None), (3, 7),
+])
+def test_run_threaded_matches_scalar(workers, shard_size):
+    expected = [homework.read_package(*package).show_training_info()
+                for package in PACKAGES]
+    infos = threaded.run_threaded(PACKAGES, workers, shard_size)
+    assert [info.get_message() for info in infos] == [
+        info.get_message() for info in expected
+    ]
+
+
+@pytest.mark.parametrize('package', [
+    ('RUN', [1, 0, 1]),
+    ('WLK', [9000, 1, 75, 0]),
+])
+def test_run_threaded_zero_division(package):
+    with pytest.raises(ZeroDivisionError):
+        homework.read_package(*package).show_training_info()
+    with pytest.raises(ZeroDivisionError):
+        threaded.run_threaded([package], workers=1)
+    with pytest.raises(ZeroDivisionError):
+        threaded.run_threaded(PACKAGES + [package], workers=2)
+
+
+def test_run_threaded_empty():
+    assert threaded.run_threaded([], workers=2) == []
+
+
+def test_default_workers():
+    assert threaded.default_workers() >= 1
+    assert isinstance(threaded.gil_enabled(), bool)
+
+
+def test_thread_scaling_report():
+    report = bench.run(sizes=(30,), threads=2)
+    assert set(report['threads']['30']) == {'1', '2'}
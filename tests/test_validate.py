@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+import homework
+import validate
+
+
+@pytest.mark.parametrize('workout_type, data, reason, field', [
+    ('BOX', [1, 1, 1], validate.UNKNOWN_CODE, None),
+    (None, [1, 1, 1], validate.UNKNOWN_CODE, None),
+    ('RUN', [15000, 1], validate.BAD_ARITY, None),
+    ('RUN', 'oops', validate.BAD_ARITY, None),
+    ('WLK', [9000, '1', 75, 180], validate.BAD_TYPE, 'duration'),
+    ('WLK', [9000, 1, 75, True], validate.BAD_TYPE, 'height'),
+    ('RUN', [9000, float('nan'), 75], validate.BAD_TYPE, 'duration'),
+    ('RUN', [15000, 0, 75], validate.OUT_OF_RANGE, 'duration'),
+    ('SWM', [720, 1, 80, 25, -1], validate.OUT_OF_RANGE, 'count_pool'),
+    ('RUN', [-1, 1, 75], validate.OUT_OF_RANGE, 'action'),
+    ('RUN', [10**400, 1, 1], validate.OUT_OF_RANGE, 'action'),
+    ('WLK', [1e203, 1, 75, 180], validate.OUT_OF_RANGE, 'action'),
+    ('WLK', [9000, 1e-300, 75, 180], validate.OUT_OF_RANGE, 'duration'),
+])
+def test_check_packet_rejects(workout_type, data, reason, field):
+    reject = validate.check_packet(workout_type, data)
+    assert (reject.reason, reject.field) == (reason, field)
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [0, 1.5, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('WLK', [10**9, 1e-6, 1e4, 1e-6]),
+    ('SWM', [10**9, 1e-6, 1e4, 1e4, 10**9]),
+])
+def test_check_packet_accepts(workout_type, data):
+    assert validate.check_packet(workout_type, data) is None
+    info = homework.read_package(workout_type, data).show_training_info()
+    assert all(map(math.isfinite, (info.distance, info.speed, info.calories)))
+
+
+def test_validator_survives_huge_numbers():
+    validator = validate.Validator()
+    packets = [('RUN', [10**400, 1, 1]), ('RUN', [15000, 1, 75])]
+    assert list(validator.filter(packets)) == [packets[1]]
+    assert validator.rejected == {validate.OUT_OF_RANGE: 1}
+
+
+def test_validator_routes_rejects():
+    dead_letters = []
+    validator = validate.Validator(dead_letter=dead_letters.append)
+    packets = [('RUN', [15000, 1, 75]), ('BOX', [1]), ('RUN', [1, 0, 1]),
+               ('WLK', [9000, 1, 75, 180])]
+    valid = list(validator.filter(packets))
+    assert valid == [packets[0], packets[3]]
+    assert [reject.reason for reject in dead_letters] == [
+        validate.UNKNOWN_CODE, validate.OUT_OF_RANGE
+    ]
+    assert validator.accepted == 2
+    assert validator.rejected == {validate.UNKNOWN_CODE: 1,
+                                  validate.OUT_OF_RANGE: 1}
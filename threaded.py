@@ -0,0 +1,53 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
+
+import batch
+from homework import InfoMessage, read_package
+
+
+def gil_enabled() -> bool:
+    """Проверить, работает ли интерпретатор с GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def default_workers() -> int:
+    """Число потоков, которые реально выполняются параллельно.
+
+    Ядра NumPy и сборки CPython без GIL масштабируются по потокам;
+    чистый Python под GIL — нет, поэтому тогда хватает одного потока.
+    """
+    if batch.np is not None or not gil_enabled():
+        return os.cpu_count() or 1
+    return 1
+
+
+def compute_shard(packages: Sequence) -> list[InfoMessage]:
+    """Рассчитать часть пакетов без общего изменяемого состояния."""
+    codes = {workout_type for workout_type, _ in packages}
+    if batch.np is None or not codes <= batch.KERNELS.keys():
+        return [read_package(workout_type, data).show_training_info()
+                for workout_type, data in packages]
+    columns = batch.packages_to_columns(packages)
+    result = batch.compute_batch(**columns)
+    return batch.to_messages(columns['workout_type'], columns['duration'],
+                             result)
+
+
+def run_threaded(packages: Sequence,
+                 workers: Optional[int] = None,
+                 shard_size: Optional[int] = None) -> list[InfoMessage]:
+    """Рассчитать пакеты в пуле потоков, сохраняя порядок."""
+    workers = workers or default_workers()
+    if not packages:
+        return []
+    shard_size = shard_size or -(-len(packages) // workers)
+    shards = [packages[start:start + shard_size]
+              for start in range(0, len(packages), shard_size)]
+    if workers == 1 or len(shards) == 1:
+        return [info for shard in shards for info in compute_shard(shard)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [info for infos in executor.map(compute_shard, shards)
+                for info in infos]
@@ -0,0 +1,85 @@
+import math
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional
+
+from homework import WORKOUT_TYPES, WorkoutSchema
+
+UNKNOWN_CODE: str = 'UNKNOWN_CODE'
+BAD_ARITY: str = 'BAD_ARITY'
+BAD_TYPE: str = 'BAD_TYPE'
+OUT_OF_RANGE: str = 'OUT_OF_RANGE'
+
+LIMITS: dict[str, tuple[float, float]] = {
+    'action': (0, 1e9),
+    'duration': (1e-6, 1e4),
+    'weight': (1e-6, 1e4),
+    'height': (1e-6, 1e4),
+    'length_pool': (1e-6, 1e4),
+    'count_pool': (0, 1e9),
+}
+NUMBER_TYPES: frozenset = frozenset({int, float})
+
+
+@dataclass
+class Reject:
+    """Отклонённый пакет с кодом причины."""
+    workout_type: object
+    data: object
+    reason: str
+    field: Optional[str] = None
+
+
+@lru_cache(maxsize=None)
+def range_rules(schema: WorkoutSchema
+                ) -> tuple[tuple[int, str, float, float], ...]:
+    """Собрать проверки диапазонов для полей вида тренировки.
+
+    Границы `LIMITS` подобраны так, чтобы расчёт любого принятого
+    пакета не переполнял `float`.
+    """
+    return tuple((index, field, *LIMITS[field])
+                 for index, field in enumerate(schema.fields)
+                 if field in LIMITS)
+
+
+def check_packet(workout_type, data) -> Optional[Reject]:
+    """Проверить пакет без создания тренировки и без исключений."""
+    schema = (WORKOUT_TYPES.get(workout_type)
+              if isinstance(workout_type, str) else None)
+    if schema is None:
+        return Reject(workout_type, data, UNKNOWN_CODE)
+    if not isinstance(data, (list, tuple)) or len(data) != schema.arity:
+        return Reject(workout_type, data, BAD_ARITY)
+    for field, value in zip(schema.fields, data):
+        if (type(value) not in NUMBER_TYPES
+                or type(value) is float and not math.isfinite(value)):
+            return Reject(workout_type, data, BAD_TYPE, field)
+    for index, field, low, high in range_rules(schema):
+        if not low <= data[index] <= high:
+            return Reject(workout_type, data, OUT_OF_RANGE, field)
+    return None
+
+
+class Validator:
+    """Отсеивает некорректные пакеты в очередь отказов."""
+
+    def __init__(self,
+                 dead_letter: Optional[Callable[[Reject], None]] = None
+                 ) -> None:
+        self.dead_letter: Optional[Callable[[Reject], None]] = dead_letter
+        self.accepted: int = 0
+        self.rejected: Counter = Counter()
+
+    def filter(self, packets: Iterable) -> Iterator[tuple[str, list]]:
+        """Пропустить дальше только корректные пакеты."""
+        for workout_type, data in packets:
+            reject = check_packet(workout_type, data)
+            if reject is None:
+                self.accepted += 1
+                yield workout_type, data
+                continue
+            self.rejected[reject.reason] += 1
+            if self.dead_letter is not None:
+                self.dead_letter(reject)